@@ -206,6 +206,7 @@ def mypy(session):
     """
     session.install(f"mypy{DEV_REQUIREMENTS['mypy']}")
     session.install(f"pytest{DEV_REQUIREMENTS['pytest']}")
+    session.install(f"types-PyYAML{DEV_REQUIREMENTS['types-PyYAML']}")
     session.install(".")
     session.run("python", "-m", "mypy", "--strict", "scrapli_replay/")
 
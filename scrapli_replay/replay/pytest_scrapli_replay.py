@@ -1,7 +1,8 @@
 """scrapli_replay.pytest.scrapli_replay"""
 
 from pathlib import Path
-from typing import Any, AsyncIterator, Iterator, List, Tuple
+from typing import Any, AsyncIterator, Dict, Iterator, List, Tuple
+from weakref import WeakKeyDictionary
 
 import _pytest
 import pytest
@@ -10,6 +11,13 @@ SubRequest = _pytest.fixtures.SubRequest  # pylint: disable=W0212
 Config = _pytest.config.Config  # pylint: disable=W0212;
 Parser = _pytest.config.argparsing.Parser  # pylint: disable=W0212
 
+# finalized fixture args are constant for a given config/test pair, cache them so repeated fixture
+# setups (i.e. re-runs, or both sync and async fixtures in one test) dont redo the option parsing
+# and session directory creation
+_FIXTURE_ARGS_CACHE: Dict[Tuple[int, str, str], Tuple[str, str, List[str], bool, str, bool]] = {}
+# the comma separated overwrite list only needs to be split once per pytest config object
+_OVERWRITE_CACHE: "WeakKeyDictionary[Any, List[str]]" = WeakKeyDictionary()
+
 
 def pytest_addoption(parser: Parser) -> None:
     """
@@ -113,12 +121,25 @@ def _finalize_fixture_args(request: SubRequest) -> Tuple[str, str, List[str], bo
         N/A
 
     """
+    test_name = request.node.name
+    if request.cls:
+        test_name = f"{request.cls.__name__}.{test_name}"
+
+    cache_key = (id(request.config), getattr(request.module, "__file__", ""), test_name)
+    cached_args = _FIXTURE_ARGS_CACHE.get(cache_key)
+    if cached_args is not None:
+        return cached_args
+
     opt_replay_mode = request.config.getoption("scrapli_replay_mode")
     opt_config_dir = request.config.getoption("scrapli_replay_directory")
-    opt_overwrite = request.config.getoption("scrapli_replay_overwrite").split(",")
     opt_disable = request.config.getoption("scrapli_replay_disable")
     opt_block_network = request.config.getoption("scrapli_replay_block_network")
 
+    opt_overwrite = _OVERWRITE_CACHE.get(request.config)
+    if opt_overwrite is None:
+        opt_overwrite = request.config.getoption("scrapli_replay_overwrite").split(",")
+        _OVERWRITE_CACHE[request.config] = opt_overwrite
+
     # set and make sure session directory exists
     if opt_config_dir:
         session_directory = str(Path(opt_config_dir).expanduser())
@@ -126,11 +147,7 @@ def _finalize_fixture_args(request: SubRequest) -> Tuple[str, str, List[str], bo
         session_directory = f"{Path(request.module.__file__).parents[0]}/scrapli_replay_sessions"
     Path(session_directory).mkdir(exist_ok=True)
 
-    test_name = request.node.name
-    if request.cls:
-        test_name = f"{request.cls.__name__}.{test_name}"
-
-    return (
+    finalized_args = (
         opt_replay_mode,
         session_directory,
         opt_overwrite,
@@ -138,6 +155,8 @@ def _finalize_fixture_args(request: SubRequest) -> Tuple[str, str, List[str], bo
         test_name,
         opt_block_network,
     )
+    _FIXTURE_ARGS_CACHE[cache_key] = finalized_args
+    return finalized_args
 
 
 @pytest.fixture(scope="function", autouse=True)
@@ -2,19 +2,32 @@
 
 # pylint: disable=C0302
 import asyncio
+import copy
+import operator
+import os
+import pickle
 import re
+import sys
 import types
-from dataclasses import asdict, dataclass
+from array import array
+from collections import deque
 from datetime import datetime
 from enum import Enum
-from io import BytesIO
 from pathlib import Path
 from types import TracebackType
-from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type, Union
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Type, Union
 from unittest import mock
 
 import pytest
-import ruamel.yaml
+import yaml
+
+try:
+    from yaml import CSafeDumper as YamlDumper
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    # no libyaml bindings available, fall back to the pure python loader/dumper
+    from yaml import SafeDumper as YamlDumper  # type: ignore
+    from yaml import SafeLoader as YamlLoader  # type: ignore
 
 import scrapli
 from scrapli.channel.async_channel import AsyncChannel
@@ -29,11 +42,212 @@ from scrapli_replay.exceptions import (
     ScrapliReplayExpectedInputError,
 )
 
-YAML = ruamel.yaml.YAML(typ="safe", pure=True)
-
 # used to replace scrapli cfg session name/id in channel write log
 SCRAPLI_CFG_SESSION_PATTERN = re.compile(pattern=r"scrapli_cfg_\d+")
 
+# interaction dict keys interned once so per-interaction dict builds in _serialize_instance reuse
+# the exact same key objects (id-equal keys hash/compare fastest), plus the shared redaction
+# sentinel value
+_K_OUT = sys.intern("channel_output")
+_K_IN = sys.intern("expected_channel_input")
+_K_RED = sys.intern("expected_channel_input_redacted")
+_REDACTED = "REDACTED"
+
+# pulls the connection attributes recorded in a profile off a scrapli connection in one c-level
+# call instead of eight separate python attribute lookups
+_PROFILE_GETTER = operator.attrgetter(
+    "host",
+    "port",
+    "auth_username",
+    "auth_password",
+    "auth_private_key",
+    "auth_private_key_passphrase",
+    "auth_bypass",
+    "transport_name",
+)
+
+# parsed session data cached per path -- (st_mtime_ns, st_size, parsed session); test suites tend
+# to load the same session file many times, no reason to re-parse it if it hasnt changed on disk
+_SESSION_CACHE: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+# opt-in on-disk pickle sidecar cache (session.yaml.pkl) -- skips the yaml parse across *processes*
+# when the session file is unchanged; off by default so ci runs stay deterministic
+_PICKLE_CACHE_ENABLED = os.environ.get("SCRAPLI_REPLAY_PICKLE_CACHE", "") == "1"
+
+
+class _SessionLoader(YamlLoader):
+    """Session yaml loader -- subclassed so the interning constructor stays local to us"""
+
+
+def _construct_interned_str(loader: _SessionLoader, node: yaml.ScalarNode) -> str:
+    """
+    Construct yaml strings, interning short ones
+
+    Every session file repeats the same handful of keys and short values (interaction keys,
+    transport names, prompts); interning them de-duplicates the allocations and makes downstream
+    dict lookups cheaper. Long strings (channel output blobs) are left alone.
+
+    Args:
+        loader: yaml loader doing the loading
+        node: scalar node to construct
+
+    Returns:
+        str: constructed (possibly interned) string
+
+    Raises:
+        N/A
+
+    """
+    value: str = loader.construct_scalar(node)
+    if len(value) < 32:
+        return sys.intern(value)
+    return value
+
+
+_SessionLoader.add_constructor("tag:yaml.org,2002:str", _construct_interned_str)
+
+
+def _load_pickle_sidecar(
+    session_path: str, stat_result: os.stat_result
+) -> Optional[Dict[str, Any]]:
+    """
+    Load a session from its pickle sidecar if present and still fresh
+
+    Args:
+        session_path: path of the session yaml file the sidecar belongs to
+        stat_result: stat of the session yaml file
+
+    Returns:
+        Optional[Dict[str, Any]]: parsed session data, or None if the sidecar is missing/stale
+
+    Raises:
+        N/A
+
+    """
+    try:
+        with open(f"{session_path}.pkl", "rb") as f:
+            header, session = pickle.load(f)
+    except Exception:  # pylint: disable=W0703
+        # the sidecar is purely a cache and must never break a session load; a corrupt or
+        # wrong-shaped sidecar can raise most anything out of pickle (UnpicklingError, EOFError,
+        # ValueError, TypeError, AttributeError, ...) so catch broadly and fall back to the yaml
+        return None
+
+    if header != (stat_result.st_mtime_ns, stat_result.st_size):
+        return None
+
+    return session  # type: ignore[no-any-return]
+
+
+def _write_pickle_sidecar(
+    session_path: str, stat_result: os.stat_result, session: Dict[str, Any]
+) -> None:
+    """
+    Write a session's pickle sidecar (best effort, atomically via rename)
+
+    Args:
+        session_path: path of the session yaml file the sidecar belongs to
+        stat_result: stat of the session yaml file
+        session: parsed session data to store
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+    sidecar_path = f"{session_path}.pkl"
+    tmp_path = f"{sidecar_path}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump(
+                ((stat_result.st_mtime_ns, stat_result.st_size), session),
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp_path, sidecar_path)
+    except OSError:
+        # the sidecar is purely a cache, never let it break a session load
+        pass
+
+
+def _load_session(session_path: str) -> Dict[str, Any]:
+    """
+    Load (and cache) a saved replay session
+
+    Sessions are cached by path and invalidated on mtime/size change; a deepcopy of the cached data
+    is returned so callers remain free to mutate their copy of the session.
+
+    Args:
+        session_path: path of the session yaml file to load
+
+    Returns:
+        Dict[str, Any]: parsed session data
+
+    Raises:
+        N/A
+
+    """
+    stat_result = os.stat(session_path)
+    cached_session = _SESSION_CACHE.get(session_path)
+
+    if (
+        cached_session is not None
+        and cached_session[0] == stat_result.st_mtime_ns
+        and cached_session[1] == stat_result.st_size
+    ):
+        return copy.deepcopy(cached_session[2])
+
+    session: Optional[Dict[str, Any]] = None
+    if _PICKLE_CACHE_ENABLED:
+        session = _load_pickle_sidecar(session_path=session_path, stat_result=stat_result)
+
+    if session is None:
+        # read the whole file in one shot w/ the raw os interface -- session files are small, no
+        # need to stand up the full buffered/text io stack just to feed the yaml parser
+        fd = os.open(session_path, os.O_RDONLY)
+        try:
+            session_bytes = os.read(fd, stat_result.st_size)
+        finally:
+            os.close(fd)
+        session = yaml.load(session_bytes, Loader=_SessionLoader)
+
+        if _PICKLE_CACHE_ENABLED:
+            _write_pickle_sidecar(
+                session_path=session_path, stat_result=stat_result, session=session
+            )
+
+    _SESSION_CACHE[session_path] = (stat_result.st_mtime_ns, stat_result.st_size, session)
+
+    return copy.deepcopy(session)
+
+
+_PROCESS_CWD: Optional[str] = None
+
+
+def _cwd() -> Path:
+    """
+    Return the process working directory, resolving it at most once
+
+    Path.cwd() pays for a getcwd syscall plus full pathlib construction on every call; default
+    session directories only need the value once per process.
+
+    Args:
+        N/A
+
+    Returns:
+        Path: process working directory
+
+    Raises:
+        N/A
+
+    """
+    global _PROCESS_CWD  # pylint: disable=W0603
+    if _PROCESS_CWD is None:
+        _PROCESS_CWD = os.getcwd()
+    return Path(_PROCESS_CWD)
+
 
 class ReplayMode(Enum):
     RECORD = "record"
@@ -41,19 +255,130 @@ class ReplayMode(Enum):
     OVERWRITE = "overwrite"
 
 
-@dataclass()
+# field order used for fast connection profile comparisons -- tuple compare bails on the first
+# differing element instead of hashing every key like a dict equality would
+_PROFILE_FIELDS: Tuple[str, ...] = (
+    "host",
+    "port",
+    "auth_username",
+    "auth_password",
+    "auth_private_key",
+    "auth_private_key_passphrase",
+    "auth_bypass",
+    "transport",
+    "auth_secondary",
+)
+
+
 class ConnectionProfile:
-    # password things will just be False for not used, or True for used, we'll never store them
-    host: str
-    port: int
-    auth_username: str
-    auth_password: bool
-    auth_private_key: str
-    auth_private_key_passphrase: bool
-    auth_bypass: bool
-    transport: str
-    # auth secondary only applies to network drivers, so its optional
-    auth_secondary: bool = False
+    __slots__ = _PROFILE_FIELDS
+
+    def __init__(  # pylint: disable=R0913,R0917
+        self,
+        host: str,
+        port: int,
+        auth_username: str,
+        auth_password: bool,
+        auth_private_key: str,
+        auth_private_key_passphrase: bool,
+        auth_bypass: bool,
+        transport: str,
+        auth_secondary: bool = False,
+    ) -> None:
+        """
+        Connection profile for a wrapped scrapli connection
+
+        Password things will just be False for not used, or True for used, we'll never store them;
+        auth secondary only applies to network drivers, so its optional. Slotted (rather than a
+        dataclass) so instances skip the per-object __dict__.
+
+        Args:
+            host: host of the wrapped connection
+            port: port of the wrapped connection
+            auth_username: username of the wrapped connection
+            auth_password: True/False a password was used
+            auth_private_key: private key of the wrapped connection
+            auth_private_key_passphrase: True/False a private key passphrase was used
+            auth_bypass: True/False auth bypass was used
+            transport: transport of the wrapped connection
+            auth_secondary: True/False secondary auth password was used
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self.host = host
+        self.port = port
+        self.auth_username = auth_username
+        self.auth_password = auth_password
+        self.auth_private_key = auth_private_key
+        self.auth_private_key_passphrase = auth_private_key_passphrase
+        self.auth_bypass = auth_bypass
+        self.transport = transport
+        self.auth_secondary = auth_secondary
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare connection profiles field by field
+
+        Args:
+            other: object to compare against
+
+        Returns:
+            bool: True if all fields match
+
+        Raises:
+            N/A
+
+        """
+        if not isinstance(other, ConnectionProfile):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in _PROFILE_FIELDS)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Dump the connection profile to a plain (yaml friendly) dict
+
+        Args:
+            N/A
+
+        Returns:
+            Dict[str, Any]: field name -> value mapping
+
+        Raises:
+            N/A
+
+        """
+        return {field: getattr(self, field) for field in _PROFILE_FIELDS}
+
+
+def _represent_connection_profile(
+    dumper: "YamlDumper", connection_profile: ConnectionProfile
+) -> yaml.MappingNode:
+    """
+    Represent a ConnectionProfile as a plain yaml mapping
+
+    Registered once at import so _serialize can hand profile objects straight to the dumper without
+    converting them to dicts per save.
+
+    Args:
+        dumper: yaml dumper doing the dumping
+        connection_profile: profile to represent
+
+    Returns:
+        yaml.MappingNode: mapping node for the profile
+
+    Raises:
+        N/A
+
+    """
+    return dumper.represent_dict(connection_profile.to_dict())
+
+
+YamlDumper.add_representer(ConnectionProfile, _represent_connection_profile)
 
 
 class ScrapliReplayInstance:
@@ -82,14 +407,26 @@ class ScrapliReplayInstance:
         self.replay_mode = replay_mode
         self.connection_profile = connection_profile
 
+        # profile values/fingerprint computed once up front -- replay mode connect checks then
+        # start with a single int compare instead of rebuilding the live profile tuple per call
+        self._profile_values = tuple(
+            getattr(connection_profile, field) for field in _PROFILE_FIELDS
+        )
+        self._profile_fingerprint = hash(self._profile_values)
+
         self.replay_session = replay_session or {}
 
-        self.read_log = BytesIO()
-        self.write_log: List[Tuple[str, bool, int]] = []
+        # read log is a single byte buffer; the write log is stored struct-of-arrays style in three
+        # parallel sequences (input, redacted flag, read log offset) to avoid per-write tuple
+        # churn -- offsets live in an array so they are packed 8 bytes each rather than boxed ints
+        self._read_buf = bytearray()
+        self._write_inputs: List[str] = []
+        self._write_redacted: List[bool] = []
+        self._write_offsets = array("Q")
 
         self._scrapli_cfg_session = ""
 
-    def _common_replay_mode(self) -> Tuple[Iterator[str], Iterator[Tuple[str, bool]]]:
+    def _common_replay_mode(self) -> Tuple[Deque[bytes], Deque[Tuple[str, bool]]]:
         """
         Handle common replay mode parsing of saved session data (common between sync/async)
 
@@ -97,31 +434,44 @@ class ScrapliReplayInstance:
             N/A
 
         Returns:
-            Tuple[Iterator[str], Iterator[Tuple[str, bool]]]: returns the device_outputs and
-                scrapli_inputs iterators to use in the replay read/write methods
+            Tuple[Deque[bytes], Deque[Tuple[str, bool]]]: returns the (pre-encoded) device_outputs
+                and scrapli_inputs deques to use in the replay read/write methods
 
         Raises:
             ScrapliReplayConnectionProfileError: if recorded connection profile does not match the
                 actual connection profile
 
         """
-        actual_connection_profile = ConnectionProfile(**self.replay_session["connection_profile"])
-
-        if actual_connection_profile != self.connection_profile:
+        recorded_profile = self.replay_session["connection_profile"]
+        if isinstance(recorded_profile, ConnectionProfile):
+            # session came straight from the in-process save cache, profile is still an object
+            recorded_values = tuple(getattr(recorded_profile, field) for field in _PROFILE_FIELDS)
+        else:
+            recorded_profile.setdefault("auth_secondary", False)
+            recorded_values = tuple(recorded_profile[field] for field in _PROFILE_FIELDS)
+
+        # fingerprint mismatch proves inequality without touching the tuples; matching
+        # fingerprints are confirmed with the (rarely reached) tuple compare to rule out hash
+        # collisions
+        if (
+            hash(recorded_values) != self._profile_fingerprint
+            or recorded_values != self._profile_values
+        ):
             msg = "recorded connection profile does not match current connection profile"
             raise ScrapliReplayConnectionProfileError(msg)
 
-        device_outputs = iter(
-            [interaction["channel_output"] for interaction in self.replay_session["interactions"]]
+        # encode everything up front; the patched read methods then pop ready-to-go bytes instead
+        # of paying for a utf-8 encode per channel read
+        device_outputs = deque(
+            interaction["channel_output"].encode()
+            for interaction in self.replay_session["interactions"]
         )
-        scrapli_inputs = iter(
-            [
-                (
-                    interaction["expected_channel_input"],
-                    interaction["expected_channel_input_redacted"],
-                )
-                for interaction in self.replay_session["interactions"]
-            ]
+        scrapli_inputs = deque(
+            (
+                interaction["expected_channel_input"],
+                interaction["expected_channel_input_redacted"],
+            )
+            for interaction in self.replay_session["interactions"]
         )
         return device_outputs, scrapli_inputs
 
@@ -162,14 +512,14 @@ class ScrapliReplayInstance:
         self._patch_write_replay(scrapli_conn=scrapli_conn, scrapli_inputs=scrapli_inputs)
 
     def _patch_async_read_replay(
-        self, scrapli_conn: AsyncDriver, device_outputs: Iterator[str]
+        self, scrapli_conn: AsyncDriver, device_outputs: Deque[bytes]
     ) -> None:
         """
         Patch scrapli AsyncChannel read method in "replay" mode
 
         Args:
             scrapli_conn: scrapli connection to fetch data from
-            device_outputs: iterator of inputs that the read method should return for the "fake"
+            device_outputs: deque of outputs that the read method should return for the "fake"
                 connection
 
         Returns:
@@ -194,18 +544,17 @@ class ScrapliReplayInstance:
                 ScrapliReplayException: if there are no more outputs from the session to replay
 
             """
-            try:
-                buf = next(device_outputs).encode()
+            if not device_outputs:
+                msg = "No more device outputs to replay"
+                raise ScrapliReplayException(msg)
 
-                # if we see this string we know we actually need to ship out the current scrapli cfg
-                # session name that we capture during the replay write method
-                if b"__SCRAPLI_CFG_SESSION_NAME__" in buf and self._scrapli_cfg_session:
-                    buf = self._scrapli_cfg_session.encode()
-                    self._scrapli_cfg_session = ""
+            buf = device_outputs.popleft()
 
-            except StopIteration as exc:
-                msg = "No more device outputs to replay"
-                raise ScrapliReplayException(msg) from exc
+            # if we see this string we know we actually need to ship out the current scrapli cfg
+            # session name that we capture during the replay write method
+            if b"__SCRAPLI_CFG_SESSION_NAME__" in buf and self._scrapli_cfg_session:
+                buf = self._scrapli_cfg_session.encode()
+                self._scrapli_cfg_session = ""
 
             cls.logger.debug(f"read: {repr(buf)}")
 
@@ -221,13 +570,13 @@ class ScrapliReplayInstance:
             patched_read, scrapli_conn.channel
         )
 
-    def _patch_read_replay(self, scrapli_conn: Driver, device_outputs: Iterator[str]) -> None:
+    def _patch_read_replay(self, scrapli_conn: Driver, device_outputs: Deque[bytes]) -> None:
         """
         Patch scrapli Channel read method in "replay" mode
 
         Args:
             scrapli_conn: scrapli connection to fetch data from
-            device_outputs: iterator of inputs that the read method should return for the "fake"
+            device_outputs: deque of outputs that the read method should return for the "fake"
                 connection
 
         Returns:
@@ -252,18 +601,17 @@ class ScrapliReplayInstance:
                 ScrapliReplayException: if there are no more outputs from the session to replay
 
             """
-            try:
-                buf = next(device_outputs).encode()
+            if not device_outputs:
+                msg = "No more device outputs to replay"
+                raise ScrapliReplayException(msg)
 
-                # if we see this string we know we actually need to ship out the current scrapli cfg
-                # session name that we capture during the replay write method
-                if b"__SCRAPLI_CFG_SESSION_NAME__" in buf and self._scrapli_cfg_session:
-                    buf = self._scrapli_cfg_session.encode()
-                    self._scrapli_cfg_session = ""
+            buf = device_outputs.popleft()
 
-            except StopIteration as exc:
-                msg = "No more device outputs to replay"
-                raise ScrapliReplayException(msg) from exc
+            # if we see this string we know we actually need to ship out the current scrapli cfg
+            # session name that we capture during the replay write method
+            if b"__SCRAPLI_CFG_SESSION_NAME__" in buf and self._scrapli_cfg_session:
+                buf = self._scrapli_cfg_session.encode()
+                self._scrapli_cfg_session = ""
 
             cls.logger.debug(f"read: {repr(buf)}")
 
@@ -280,7 +628,7 @@ class ScrapliReplayInstance:
         )
 
     def _patch_write_replay(
-        self, scrapli_conn: Union[AsyncDriver, Driver], scrapli_inputs: Iterator[Tuple[str, bool]]
+        self, scrapli_conn: Union[AsyncDriver, Driver], scrapli_inputs: Deque[Tuple[str, bool]]
     ) -> None:
         """
         Patch scrapli Channel write method in "replay" mode
@@ -313,10 +661,10 @@ class ScrapliReplayInstance:
                 ScrapliReplayExpectedInputError: if actual input does not match expected input
 
             """
-            expected_input, expected_redacted = next(scrapli_inputs)
+            expected_input, expected_redacted = scrapli_inputs.popleft()
 
             if redacted is True:
-                _channel_input = "REDACTED"
+                _channel_input = _REDACTED
             elif re.search(pattern=SCRAPLI_CFG_SESSION_PATTERN, string=channel_input):
                 _channel_input = re.sub(
                     pattern=SCRAPLI_CFG_SESSION_PATTERN,
@@ -333,7 +681,7 @@ class ScrapliReplayInstance:
                 msg = "expected channel input does not match actual channel input"
                 raise ScrapliReplayExpectedInputError(msg)
 
-            log_output = "REDACTED" if redacted else repr(channel_input)
+            log_output = _REDACTED if redacted else repr(channel_input)
             cls.logger.debug(f"write: {log_output}")
 
         scrapli_conn.channel.write = types.MethodType(  # type: ignore
@@ -414,7 +762,7 @@ class ScrapliReplayInstance:
             if b"\x1b" in buf.lower():
                 buf = cls._strip_ansi(buf=buf)  # pylint: disable=W0212
 
-            self.read_log.write(buf)
+            self._read_buf.extend(buf)
 
             return buf
 
@@ -462,7 +810,7 @@ class ScrapliReplayInstance:
             if b"\x1b" in buf.lower():
                 buf = cls._strip_ansi(buf=buf)  # pylint: disable=W0212
 
-            self.read_log.write(buf)
+            self._read_buf.extend(buf)
 
             return buf
 
@@ -510,9 +858,11 @@ class ScrapliReplayInstance:
                 string=channel_input,
             )
 
-            self.write_log.append((_channel_input, redacted, self.read_log.tell()))
+            self._write_inputs.append(_channel_input)
+            self._write_redacted.append(redacted)
+            self._write_offsets.append(len(self._read_buf))
 
-            log_output = "REDACTED" if redacted else repr(channel_input)
+            log_output = _REDACTED if redacted else repr(channel_input)
             cls.logger.debug(f"write: {log_output}")
 
             cls.transport.write(channel_input=channel_input.encode())
@@ -538,27 +888,32 @@ class ScrapliReplayInstance:
             N/A
 
         """
-        updatedwrite_log = []
-        for write_log_entry in self.write_log:
-            updatedwrite_log.append(write_log_entry)
-            if write_log_entry[1] is True:
+        end = 0
+        for end, redacted in enumerate(self._write_redacted):
+            if redacted is True:
                 break
+        updated_inputs = self._write_inputs[: end + 1]
+        updated_redacted = self._write_redacted[: end + 1]
+        updated_offsets = self._write_offsets[: end + 1]
         # append the *last* entry in the write log back to the updated list -- this will
         # get us reading up through the banner/initial prompt
-        updatedwrite_log.append(self.write_log[-1])
+        updated_inputs.append(self._write_inputs[-1])
+        updated_redacted.append(self._write_redacted[-1])
+        updated_offsets.append(self._write_offsets[-1])
 
         # for telnet connections we may have some "dead space" (empty reads) at the
         # beginning of the interactions, get rid of that as it is not needed here
         index = 0
-        for index, write_log_entry in enumerate(updatedwrite_log):
-            if write_log_entry[0] == auth_username:
+        for index, write_input in enumerate(updated_inputs):
+            if write_input == auth_username:
                 # we've got the index of the updated write log starting at the username
                 # we know we can slice everything off before this now
                 break
-        updatedwrite_log = updatedwrite_log[index:]
 
         # finally update the replay class write log w/ our modified version
-        self.write_log = updatedwrite_log
+        self._write_inputs = updated_inputs[index:]
+        self._write_redacted = updated_redacted[index:]
+        self._write_offsets = updated_offsets[index:]
 
 
 class ScrapliReplay:
@@ -588,7 +943,7 @@ class ScrapliReplay:
 
         """
         if session_directory is None or not Path(session_directory).is_dir():
-            self.session_directory = Path.cwd()
+            self.session_directory = _cwd()
         else:
             self.session_directory = Path(session_directory)
 
@@ -598,6 +953,9 @@ class ScrapliReplay:
             session_name or f"scrapli_replay_session_{round(datetime.now().timestamp())}"
         )
 
+        # session path is used in several places (exists check, load, save), build it once
+        self._session_path_str = f"{self.session_directory}/{self.session_name}.yaml"
+
         if replay_mode not in (
             "record",
             "replay",
@@ -617,10 +975,7 @@ class ScrapliReplay:
 
         self.replay_session: Dict[str, Any] = {}
         if self.replay_mode == ReplayMode.REPLAY:
-            with open(
-                f"{self.session_directory}/{self.session_name}.yaml", "r", encoding="utf-8"
-            ) as f:
-                self.replay_session = YAML.load(f)
+            self.replay_session = _load_session(self._session_path_str)
             # if we open a session and there are no interactions recorded for any of the hosts then
             # something is not right -- we will need to re-record a session
             if not all(
@@ -966,15 +1321,26 @@ class ScrapliReplay:
             N/A
 
         """
+        (
+            host,
+            port,
+            auth_username,
+            auth_password,
+            auth_private_key,
+            auth_private_key_passphrase,
+            auth_bypass,
+            transport,
+        ) = _PROFILE_GETTER(scrapli_conn)
+
         recorded_connection_profile = ConnectionProfile(
-            host=scrapli_conn.host,
-            port=scrapli_conn.port,
-            auth_username=scrapli_conn.auth_username,
-            auth_password=bool(scrapli_conn.auth_password),
-            auth_private_key=scrapli_conn.auth_private_key,
-            auth_private_key_passphrase=bool(scrapli_conn.auth_private_key_passphrase),
-            auth_bypass=scrapli_conn.auth_bypass,
-            transport=scrapli_conn.transport_name,
+            host=host,
+            port=port,
+            auth_username=auth_username,
+            auth_password=bool(auth_password),
+            auth_private_key=auth_private_key,
+            auth_private_key_passphrase=bool(auth_private_key_passphrase),
+            auth_bypass=auth_bypass,
+            transport=transport,
         )
 
         if isinstance(scrapli_conn, NetworkDriver):
@@ -996,95 +1362,124 @@ class ScrapliReplay:
             N/A
 
         """
-        if Path(f"{self.session_directory}/{self.session_name}.yaml").is_file():
-            return True
-        return False
+        try:
+            os.stat(self._session_path_str)
+        except OSError:
+            return False
+        return True
 
-    def _serialize(self) -> Dict[str, Any]:
+    @staticmethod
+    def _serialize_instance(replay_instance: "ScrapliReplayInstance") -> Dict[str, Any]:
         """
-        Serialize in memory session data into a yaml-friendly output
+        Serialize a single replay instance's in memory session data into a yaml-friendly output
 
         Args:
-            N/A
+            replay_instance: replay instance to serialize
 
         Returns:
-             None
+            Dict[str, Any]: serialized session data for the given instance
 
         Raises:
             N/A
 
         """
-        instance_replay_sessions = {}
+        instance_read_buf = replay_instance._read_buf  # pylint: disable=W0212
 
-        for instance_name, replay_instance in self.wrapped_instances.items():
-            instance_read_log = replay_instance.read_log
-            instance_write_log = replay_instance.write_log
+        instance_replay_session: Dict[str, Any] = {}
+
+        connection_profile = replay_instance.connection_profile
+        if isinstance(connection_profile, ConnectionProfile):
+            # the registered representer dumps the profile object as a plain mapping
+            instance_replay_session["connection_profile"] = connection_profile
+        else:
+            # connection was already open so we couldn't patch it
+            instance_replay_session["connection_profile"] = {}
 
-            read_log_len = instance_read_log.tell()
-            instance_read_log.seek(0)
+        instance_replay_session["interactions"] = []
 
-            instance_replay_session: Dict[str, Any] = {}
-            instance_replay_sessions[instance_name] = instance_replay_session
+        # slice through a single memoryview -- slicing the bytearray directly would copy each
+        # chunk twice (bytearray slice, then bytes conversion), the view slices copy once
+        buf_view = memoryview(instance_read_buf)
 
+        # all things after the "initial output" is an "interaction"
+        previous_read_to_position = 0
+        for write_input, redacted, read_to_position in zip(
+            replay_instance._write_inputs,  # pylint: disable=W0212
+            replay_instance._write_redacted,  # pylint: disable=W0212
+            replay_instance._write_offsets,  # pylint: disable=W0212
+        ):
+            channel_bytes_output = bytes(buf_view[previous_read_to_position:read_to_position])
             try:
-                instance_replay_session["connection_profile"] = asdict(
-                    replay_instance.connection_profile
-                )
-            except TypeError:
-                # connection was already open so we couldn't patch it
-                instance_replay_session["connection_profile"] = {}
+                channel_output = channel_bytes_output.decode()
+            except UnicodeDecodeError:
+                # unclear if this will ever be a problem... leaving it in this try/except for
+                # posterity...
+                channel_output = channel_bytes_output.decode(errors="ignore")
+
+            # replace any output w/ the scrapli cfg replace pattern
+            channel_output = re.sub(
+                pattern=SCRAPLI_CFG_SESSION_PATTERN,
+                repl="__SCRAPLI_CFG_SESSION_NAME__",
+                string=channel_output,
+            )
 
-            instance_replay_session["interactions"] = []
+            instance_replay_session["interactions"].append(
+                {
+                    _K_OUT: channel_output,
+                    _K_IN: write_input if not redacted else _REDACTED,
+                    _K_RED: redacted,
+                }
+            )
+            previous_read_to_position = read_to_position
 
-            # all things after the "initial output" is an "interaction"
-            previous_read_to_position = 0
-            for write_data in instance_write_log:
-                write_input, redacted, read_to_position = write_data
+        # we can end up w/ "extra" data if we dont close the connection -- as in scrapli
+        # will have read one more thing than it wrote -- so we always tack on one final
+        # interaction containing whatever read log data remains (an empty string if none)
+        if previous_read_to_position < len(instance_read_buf):
+            tail_output = bytes(buf_view[previous_read_to_position:]).decode()
+        else:
+            tail_output = ""
+        instance_replay_session["interactions"].append(
+            {
+                _K_OUT: tail_output,
+                _K_IN: None,
+                _K_RED: False,
+            }
+        )
 
-                channel_bytes_output = instance_read_log.read(
-                    read_to_position - previous_read_to_position
-                )
-                try:
-                    channel_output = channel_bytes_output.decode()
-                except UnicodeDecodeError:
-                    # unclear if this will ever be a problem... leaving it in this try/except for
-                    # posterity...
-                    channel_output = channel_bytes_output.decode(errors="ignore")
-
-                # replace any output w/ the scrapli cfg replace pattern
-                channel_output = re.sub(
-                    pattern=SCRAPLI_CFG_SESSION_PATTERN,
-                    repl="__SCRAPLI_CFG_SESSION_NAME__",
-                    string=channel_output,
-                )
+        # release the view so the underlying bytearray is resizable again
+        buf_view.release()
 
-                instance_replay_session["interactions"].append(
-                    {
-                        "channel_output": channel_output,
-                        "expected_channel_input": write_input if not redacted else "REDACTED",
-                        "expected_channel_input_redacted": redacted,
-                    }
-                )
-                previous_read_to_position = read_to_position
-
-            if previous_read_to_position != read_log_len:
-                # we can end up w/ "extra" data if we dont close the connection -- as in scrapli
-                # will have read one more thing than it wrote -- so we check to see if there is
-                # remaining read log data, and if so add one final interaction
-                instance_replay_session["interactions"].append(
-                    {
-                        "channel_output": instance_read_log.read().decode(),
-                        "expected_channel_input": None,
-                        "expected_channel_input_redacted": False,
-                    }
-                )
+        return instance_replay_session
 
-        return instance_replay_sessions
+    def _serialize(self) -> Dict[str, Any]:
+        """
+        Serialize in memory session data into a yaml-friendly output
+
+        Args:
+            N/A
+
+        Returns:
+            Dict[str, Any]: serialized session data for all wrapped instances
+
+        Raises:
+            N/A
+
+        """
+        return {
+            instance_name: self._serialize_instance(replay_instance=replay_instance)
+            for instance_name, replay_instance in self.wrapped_instances.items()
+        }
 
     def _save(self) -> None:
         """
         Save the contents of a session
 
+        Each wrapped instance is serialized and dumped one at a time rather than dumping one big
+        mapping -- pyyaml builds a full representation node tree per dump call, so per-instance
+        dumps keep peak memory bounded for long recorded sessions. The dumped bytes go to disk via
+        a single os.write rather than through the buffered/text io stack.
+
         Args:
             N/A
 
@@ -1095,6 +1490,36 @@ class ScrapliReplay:
             N/A
 
         """
-        with open(f"{self.session_directory}/{self.session_name}.yaml", "w", encoding="utf-8") as f:
-            YAML.indent(mapping=2, sequence=4, offset=2)
-            YAML.dump(self._serialize(), f)
+        session_path = self._session_path_str
+        serialized_sessions: Dict[str, Any] = {}
+
+        out_buf = bytearray()
+        if not self.wrapped_instances:
+            out_buf += yaml.dump({}, Dumper=YamlDumper, default_flow_style=False, encoding="utf-8")
+
+        for instance_name, replay_instance in self.wrapped_instances.items():
+            instance_replay_session = self._serialize_instance(replay_instance=replay_instance)
+            serialized_sessions[instance_name] = instance_replay_session
+            # top level keys are unique, so sequential dumps of single-key mappings concatenate
+            # into one valid yaml document
+            out_buf += yaml.dump(
+                {instance_name: instance_replay_session},
+                Dumper=YamlDumper,
+                default_flow_style=False,
+                encoding="utf-8",
+            )
+
+        fd = os.open(session_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, out_buf)
+        finally:
+            os.close(fd)
+
+        # refresh the session cache with the data we just wrote so a subsequent replay of this
+        # session doesnt need to re-parse the yaml we just dumped
+        stat_result = os.stat(session_path)
+        _SESSION_CACHE[session_path] = (
+            stat_result.st_mtime_ns,
+            stat_result.st_size,
+            serialized_sessions,
+        )
@@ -5,7 +5,13 @@ from dataclasses import asdict, dataclass
 from io import BytesIO
 from typing import Any, Dict, List, Optional, Tuple, Union, cast
 
-from ruamel.yaml import YAML
+import yaml
+
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:
+    # no libyaml bindings available, fall back to the pure python dumper
+    from yaml import SafeDumper as YamlDumper  # type: ignore
 
 from scrapli import Scrapli
 from scrapli.channel.sync_channel import Channel
@@ -190,10 +196,10 @@ class ScrapliCollector:
         self._privilege_deescalate_inputs: List[str] = []
         self._interact_privilege_escalations: List[List[Tuple[str, str, bool]]] = []
 
-        self.events: Dict[str, Dict[str, Dict[str, Union[StandardEvent, InteractiveEvent]]]] = {
-            privilege_level_name: {"pre_on_open": {}, "post_on_open": {}}
-            for privilege_level_name in platform_privilege_levels
-        }
+        # events are stored flat -- keyed by (privilege level, on open state, channel input) -- so
+        # that reads/writes are a single dict lookup; the nested (yaml friendly) layout is only
+        # built at serialization time
+        self.events: Dict[Tuple[str, str, str], Union[StandardEvent, InteractiveEvent]] = {}
         self.dumpable_events: Dict[str, Dict[str, Dict[str, Any]]] = {
             privilege_level_name: {"pre_on_open": {}, "post_on_open": {}}
             for privilege_level_name in platform_privilege_levels
@@ -216,6 +222,23 @@ class ScrapliCollector:
 
         self._determine_privilege_inputs()
 
+    @property
+    def _on_open_enabled_key(self) -> str:
+        """
+        Return the events key for the current on open state
+
+        Args:
+            N/A
+
+        Returns:
+            str: "post_on_open" if on open inputs have been ran, otherwise "pre_on_open"
+
+        Raises:
+            N/A
+
+        """
+        return "post_on_open" if self.on_open_enabled else "pre_on_open"
+
     def open(self) -> None:
         """
         Open the Collector and the underlying scrapli connection
@@ -511,7 +534,7 @@ class ScrapliCollector:
             None
 
         """
-        on_open_enabled_key = "post_on_open" if self.on_open_enabled else "pre_on_open"
+        on_open_enabled_key = self._on_open_enabled_key
 
         for priv_level in self.scrapli_connection.privilege_levels:
             logger.info(f"collecting input {channel_input} for priv level {priv_level}")
@@ -560,7 +583,7 @@ class ScrapliCollector:
                 closes_connection=closes_connection,
             )
 
-            self.events[priv_level][on_open_enabled_key][channel_input] = channel_input_event
+            self.events[(priv_level, on_open_enabled_key, channel_input)] = channel_input_event
 
     def _collect_interactive_event_hidden_input(
         self, channel_input: str, channel_response: str
@@ -673,7 +696,7 @@ class ScrapliCollector:
             None
 
         """
-        on_open_enabled_key = "post_on_open" if self.on_open_enabled else "pre_on_open"
+        on_open_enabled_key = self._on_open_enabled_key
 
         for priv_level in self.scrapli_connection.privilege_levels:
             self.scrapli_connection.acquire_priv(priv_level)
@@ -734,9 +757,9 @@ class ScrapliCollector:
                     break
 
             interactive_event.result_privilege_level = self._get_current_privilege_level_name()
-            self.events[priv_level][on_open_enabled_key][
-                initiating_channel_input
-            ] = interactive_event
+            self.events[(priv_level, on_open_enabled_key, initiating_channel_input)] = (
+                interactive_event
+            )
 
     def _collect_unknown_events(self) -> None:
         """
@@ -755,7 +778,7 @@ class ScrapliCollector:
             None
 
         """
-        on_open_enabled_key = "post_on_open" if self.on_open_enabled else "pre_on_open"
+        on_open_enabled_key = self._on_open_enabled_key
 
         for priv_level in self.scrapli_connection.privilege_levels:
             self.scrapli_connection.acquire_priv(priv_level)
@@ -901,20 +924,12 @@ class ScrapliCollector:
         """
         logger.debug("serializing collected inputs to be yaml friendly")
 
-        for privilege_level in self.events:
-            for on_open_state in self.events[privilege_level]:
-                for channel_input in self.events[privilege_level][on_open_state]:
-                    self.dumpable_events[privilege_level][on_open_state][channel_input] = asdict(
-                        self.events[privilege_level][on_open_state][channel_input]
-                    )
-                    self.dumpable_events[privilege_level][on_open_state][channel_input]["type"] = (
-                        "standard"
-                        if isinstance(
-                            self.events[privilege_level][on_open_state][channel_input],
-                            StandardEvent,
-                        )
-                        else "interactive"
-                    )
+        for (privilege_level, on_open_state, channel_input), event in self.events.items():
+            dumpable_event = asdict(event)
+            dumpable_event["type"] = (
+                "standard" if isinstance(event, StandardEvent) else "interactive"
+            )
+            self.dumpable_events[privilege_level][on_open_state][channel_input] = dumpable_event
 
         for privilege_level in self.unknown_events:
             for on_open_state in self.unknown_events[privilege_level]:
@@ -948,6 +963,4 @@ class ScrapliCollector:
         dumpable_dict["on_open_inputs"] = self.on_open_inputs
 
         with open(self.collector_session_filename, "w", encoding="utf-8") as f:
-            yaml = YAML()
-            yaml.indent(mapping=2, sequence=4, offset=2)
-            yaml.dump(dumpable_dict, f)
+            yaml.dump(dumpable_dict, f, Dumper=YamlDumper, default_flow_style=False)
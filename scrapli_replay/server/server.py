@@ -1,10 +1,18 @@
 """scrapli_replay.server.server"""
 
 import asyncio
-from enum import Enum
-from typing import Any, Dict, Optional, Type
+import sys
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    # no libyaml bindings available, fall back to the pure python loader
+    from yaml import SafeLoader as YamlLoader  # type: ignore
 
-import ruamel.yaml
 from asyncssh.channel import SSHServerChannel
 from asyncssh.connection import create_server
 from asyncssh.public_key import SSHKey
@@ -32,12 +40,142 @@ CwttJsdhYnN0En/zgzAAAAFGNhcmxAaW1wb3N0b3JlLmxvY2FsAQIDBAUG
 -----END OPENSSH PRIVATE KEY-----
 """
 
-YAML = ruamel.yaml.YAML(typ="safe", pure=True)
 
+# as in no "on_open" stuff (disable paging) has been done yet vs all on open inputs have ran;
+# plain strings (rather than an enum) so the hot path can use the state directly as a dict key
+ON_OPEN_PRE = "pre_on_open"
+ON_OPEN_POST = "post_on_open"
+
+
+class ServerEventStep:
+    __slots__ = ("channel_input", "channel_output", "hidden_input", "returns_prompt")
+
+    def __init__(self, step: Dict[str, Any]) -> None:
+        """
+        Single step of an interactive server event
+
+        Tiny `__slots__` backed container for an event step loaded from yaml -- attribute access is
+        cheaper than dict subscription in the per-keystroke server hot path.
+
+        Args:
+            step: dictionary of the step data as loaded from yaml
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self.channel_input: str = step.get("channel_input", "")
+        self.channel_output: str = step.get("channel_output", "")
+        self.hidden_input: bool = step.get("hidden_input", False)
+        self.returns_prompt: bool = step.get("returns_prompt", True)
+
+
+class ServerEvent:
+    __slots__ = (
+        "channel_output",
+        "result_privilege_level",
+        "returns_prompt",
+        "closes_connection",
+        "kind",
+        "event_steps",
+    )
+
+    def __init__(self, event: Dict[str, Any]) -> None:
+        """
+        Single server event ("standard" or "interactive")
+
+        Tiny `__slots__` backed container for an event loaded from yaml -- attribute access is
+        cheaper than dict subscription in the per-keystroke server hot path.
+
+        Args:
+            event: dictionary of the event data as loaded from yaml
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self.channel_output: str = event.get("channel_output", "")
+        self.result_privilege_level: str = event.get("result_privilege_level", "")
+        self.returns_prompt: bool = event.get("returns_prompt", True)
+        self.closes_connection: bool = event.get("closes_connection", False)
+        self.kind: str = event.get("type", "standard")
+        self.event_steps: Optional[List[ServerEventStep]] = (
+            [ServerEventStep(step) for step in event["event_steps"]]
+            if event.get("event_steps")
+            else None
+        )
+
+
+def flatten_collect_data_events(collect_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Flatten the nested events from a collected session into a single tuple-keyed dict
+
+    The yaml representation of collected data nests events by privilege level and on open state;
+    for serving sessions we want the event lookup to be a single dict hash, so build a flat dict
+    keyed by (privilege level, on open state, channel input) once at load time; unknown events get
+    the same treatment keyed by (privilege level, on open state). Event dicts are converted to
+    `__slots__` backed `ServerEvent` objects and the key strings are interned so the per-keystroke
+    lookups are as cheap as possible.
+
+    Args:
+        collect_data: dictionary of the collected data necessary to run a mock server
+
+    Returns:
+        Dict[str, Any]: collect_data with "events_flat" and "unknown_events_flat" keys added
+
+    Raises:
+        N/A
+
+    """
+    collect_data["events_flat"] = {
+        (
+            sys.intern(privilege_level),
+            sys.intern(on_open_state),
+            sys.intern(channel_input),
+        ): ServerEvent(event)
+        for privilege_level, on_open_states in collect_data["events"].items()
+        for on_open_state, channel_inputs in on_open_states.items()
+        for channel_input, event in channel_inputs.items()
+    }
+    # states with no collected unknown event are skipped entirely rather than stored as None --
+    # a lookup for such a state raises KeyError instead of handing back a None to dereference
+    collect_data["unknown_events_flat"] = {
+        (sys.intern(privilege_level), sys.intern(on_open_state)): ServerEvent(event)
+        for privilege_level, on_open_states in collect_data["unknown_events"].items()
+        for on_open_state, event in on_open_states.items()
+        if event is not None
+    }
+    return collect_data
+
+
+@lru_cache(maxsize=32)
+def load_collect_data(collect_data: str) -> Dict[str, Any]:
+    """
+    Load (and cache) collect data yaml for a given path
+
+    The server factory creates a `BaseServer` per accepted connection; caching the parsed yaml by
+    path means N concurrent connections pay for a single parse. Sessions only ever read from the
+    shared collect data (mutable bits like the on open inputs list are copied per session), so
+    sharing one parsed dict across sessions is safe.
+
+    Args:
+        collect_data: string path/name of collect data yaml file to load
+
+    Returns:
+        Dict[str, Any]: loaded (and flattened, see `flatten_collect_data_events`) collect data
+
+    Raises:
+        N/A
 
-class OnOpenState(str, Enum):
-    PRE = "pre_on_open"  # as in no "on_open" stuff (disable paging) has been done
-    POST = "post_on_open"
+    """
+    with open(collect_data, "r", encoding="utf-8") as f:
+        return flatten_collect_data_events(yaml.load(f, Loader=YamlLoader))
 
 
 class BaseSSHServerSession(SSHServerSession):  # type: ignore
@@ -63,14 +201,31 @@ class BaseSSHServerSession(SSHServerSession):  # type: ignore
 
         self._hide_input = False
         self._interacting = False
-        self._interacting_event: Optional[Dict[str, Any]] = None
+        self._interacting_event: Optional[ServerEvent] = None
+        self._interact_steps: List[ServerEventStep] = []
+        self._interact_n_steps = 0
+        self._interact_hidden_mask: Tuple[bool, ...] = ()
         self._interact_index = 0
-        self._on_open_state = OnOpenState.PRE
+        self._on_open_state = ON_OPEN_PRE
 
         self.collect_data = collect_data
 
+        # bind the flat event table directly on the session -- data_received is the hottest path
+        # in the server so skip the collect_data dict hop on every received input
+        self._events_flat: Dict[Tuple[str, str, str], ServerEvent] = self.collect_data.get(
+            "events_flat", {}
+        )
+        self._unknown_events_flat: Dict[Tuple[str, str], ServerEvent] = self.collect_data.get(
+            "unknown_events_flat", {}
+        )
+
         self._on_open_commands_list = self.collect_data["on_open_inputs"].copy()
-        self.current_privilege_level = self.collect_data["initial_privilege_level"]
+
+        self._prompts: Dict[str, str] = self.collect_data["privilege_level_prompts"]
+        self._current_prompt = ""
+        self._set_current_privilege_level(
+            privilege_level=self.collect_data["initial_privilege_level"]
+        )
 
     def connection_made(self, chan: SSHServerChannel[Any]) -> None:
         """
@@ -104,6 +259,26 @@ class BaseSSHServerSession(SSHServerSession):  # type: ignore
         """
         return True
 
+    def _set_current_privilege_level(self, privilege_level: str) -> None:
+        """
+        Set the current privilege level and cache the matching prompt
+
+        Caching the prompt here means the per-keystroke prompt repaints never have to go back to
+        the collect data dict.
+
+        Args:
+            privilege_level: name of the privilege level to set
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self.current_privilege_level = privilege_level
+        self._current_prompt = self._prompts.get(privilege_level, "")
+
     def _return_current_prompt(self) -> str:
         """
         Return the current privilege level prompt
@@ -118,10 +293,7 @@ class BaseSSHServerSession(SSHServerSession):  # type: ignore
             N/A
 
         """
-        privilege_level: str = self.collect_data["privilege_level_prompts"][
-            self.current_privilege_level
-        ]
-        return privilege_level
+        return self._current_prompt
 
     def session_started(self) -> None:
         """
@@ -158,6 +330,29 @@ class BaseSSHServerSession(SSHServerSession):  # type: ignore
         logger.debug("writing device prompt")
         self._chan.write(self._return_current_prompt())
 
+    def _begin_interactive_event(self, event: "ServerEvent") -> None:
+        """
+        Enter "interacting" mode for the given event
+
+        Caches the event steps, step count, and hidden input mask up front so the per-keystroke
+        `interactive_event` path doesn't re-subscribe/re-len the event on every call.
+
+        Args:
+            event: the interactive event to begin working through
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self._interacting = True
+        self._interacting_event = event
+        self._interact_steps = event.event_steps or []
+        self._interact_n_steps = len(self._interact_steps)
+        self._interact_hidden_mask = tuple(step.hidden_input for step in self._interact_steps)
+
     def interactive_event(self, channel_input: str) -> None:
         """
         Handle "interactive" channel input
@@ -184,16 +379,17 @@ class BaseSSHServerSession(SSHServerSession):  # type: ignore
             self._chan.set_echo(echo=True)  # type: ignore
             self._hide_input = False
 
-        event_step = self._interacting_event["event_steps"][self._interact_index]
+        steps = self._interact_steps
+        event_step = steps[self._interact_index]
 
-        if event_step["hidden_input"]:
+        if event_step.hidden_input:
             if channel_input != "scrapli":
                 # if we have bad auth, basically we'll get stuck here forever... way easier than
                 # trying to model/record all the different device types auth failures i think...
                 logger.warning("interactive event input is 'hidden' but input is not 'scrapli'")
                 self._interact_index -= 1
-                event_step = self._interacting_event["event_steps"][self._interact_index]
-        elif channel_input != event_step["channel_input"]:
+                event_step = steps[self._interact_index]
+        elif channel_input != event_step.channel_input:
             # bail out and send an invalid input message for the current priv level
             logger.warning("interactive event input does not match recorded event")
             self._interacting = False
@@ -202,12 +398,14 @@ class BaseSSHServerSession(SSHServerSession):  # type: ignore
             self.unknown_event()
             return
 
-        self._chan.write(event_step["channel_output"])
+        self._chan.write(event_step.channel_output)
 
-        if self._interact_index + 1 == len(self._interacting_event["event_steps"]):
+        if self._interact_index + 1 == self._interact_n_steps:
             # this is the last step, reset all the things
             logger.debug("interactive event complete, resetting interacting mode")
-            self.current_privilege_level = self._interacting_event["result_privilege_level"]
+            self._set_current_privilege_level(
+                privilege_level=self._interacting_event.result_privilege_level
+            )
             self._interacting = False
             self._interacting_event = None
             self._interact_index = 0
@@ -215,13 +413,13 @@ class BaseSSHServerSession(SSHServerSession):  # type: ignore
 
         self._interact_index += 1
 
-        if self._interacting_event["event_steps"][self._interact_index]["hidden_input"]:
+        if self._interact_hidden_mask[self._interact_index]:
             # next event is "hidden"... so... hide it...
             logger.debug("next interact event has hidden input, disabling channel echo")
             self._chan.set_echo(echo=False)  # type: ignore
             self._hide_input = True
 
-    def standard_event(self, channel_input: str, event: Dict[str, Any]) -> None:
+    def standard_event(self, channel_input: str, event: "ServerEvent") -> None:
         """
         Handle "normal" command channel input
 
@@ -237,20 +435,22 @@ class BaseSSHServerSession(SSHServerSession):  # type: ignore
 
         """
         # i think if one of these is true both should always be... but just in case...
-        if event["channel_output"] == "__CLOSES_CONNECTION__" or event["closes_connection"] is True:
+        if event.channel_output == "__CLOSES_CONNECTION__" or event.closes_connection is True:
             logger.debug("channel input should close connection, closing...")
             # write empty string to bump the connection closed message to a new line like a normal
             # device
             self._chan.write("")
             self.eof_received()
             # reset privilege level and on open state
-            self.current_privilege_level = self.collect_data["initial_privilege_level"]
-            self._on_open_state = OnOpenState.PRE
+            self._set_current_privilege_level(
+                privilege_level=self.collect_data["initial_privilege_level"]
+            )
+            self._on_open_state = ON_OPEN_PRE
             self._on_open_commands_list = self.collect_data["on_open_inputs"].copy()
             return
 
-        self._chan.write(event["channel_output"])
-        self.current_privilege_level = event["result_privilege_level"]
+        self._chan.write(event.channel_output)
+        self._set_current_privilege_level(privilege_level=event.result_privilege_level)
 
         # try to decide if on open things are "done"
         if channel_input in self._on_open_commands_list:
@@ -259,7 +459,7 @@ class BaseSSHServerSession(SSHServerSession):  # type: ignore
 
         if not self._on_open_commands_list:
             logger.debug("an 'on open' commands all executed, setting on open state to 'POST'")
-            self._on_open_state = OnOpenState.POST
+            self._on_open_state = ON_OPEN_POST
 
     def unknown_event(self) -> None:
         """
@@ -277,14 +477,12 @@ class BaseSSHServerSession(SSHServerSession):  # type: ignore
         """
         logger.debug("an unknown event has been initiated")
 
-        event = self.collect_data["unknown_events"][self.current_privilege_level][
-            self._on_open_state.value
-        ]
-        self._chan.write(event["channel_output"])
-        if event["closes_connection"] is True:
+        event = self._unknown_events_flat[(self.current_privilege_level, self._on_open_state)]
+        self._chan.write(event.channel_output)
+        if event.closes_connection is True:
             logger.debug("channel input should close connection, closing...")
             self.eof_received()
-        self.current_privilege_level = event["result_privilege_level"]
+        self._set_current_privilege_level(privilege_level=event.result_privilege_level)
 
     def data_received(self, data: str, datatype: Optional[int]) -> None:
         """
@@ -304,10 +502,16 @@ class BaseSSHServerSession(SSHServerSession):  # type: ignore
         _ = datatype
         # in the future we can cutoff the inputs if it is over X width if disable width has not yet
         # been ran -- not needed now but could be cool; if we just send a return, we should NOT
-        # strip that!
-        channel_input = data if data == "\n" else data.rstrip()
+        # strip that! only bother rstrip'ing (a full scan of the data) if the last char is actually
+        # whitespace
+        if data == "\n":
+            channel_input = data
+        elif data and data[-1] in " \t\r\n":
+            channel_input = data.rstrip()
+        else:
+            channel_input = data
 
-        logger.debug(f"received channel input: '{channel_input}'")
+        logger.debug("received channel input: '%s'", channel_input)
 
         if self._interacting:
             logger.debug("already in interacting mode, continuing with interact events")
@@ -319,24 +523,26 @@ class BaseSSHServerSession(SSHServerSession):  # type: ignore
             self.repaint_prompt()
             return
 
-        current_event = self.collect_data["events"][self.current_privilege_level][
-            self._on_open_state.value
-        ].get(channel_input)
-
-        if current_event:
-            if current_event["type"] == "standard":
-                logger.debug("standard channel event")
-                self.standard_event(channel_input=channel_input, event=current_event)
-            else:
-                logger.debug("interactive channel event")
-                # set to interacting mode, assign the current interactive event
-                self._interacting = True
-                self._interacting_event = current_event
-                self.interactive_event(channel_input=channel_input)
+        try:
+            # EAFP here -- the overwhelmingly common case is a recorded (known) input, so pay for
+            # the exception machinery only on the rare unknown input rather than dict.get on every
+            # received input
+            current_event = self._events_flat[
+                (self.current_privilege_level, self._on_open_state, channel_input)
+            ]
+        except KeyError:
+            logger.debug("unknown channel event")
+            self.unknown_event()
             return
 
-        logger.debug("unknown channel event")
-        self.unknown_event()
+        if current_event.kind == "standard":
+            logger.debug("standard channel event")
+            self.standard_event(channel_input=channel_input, event=current_event)
+        else:
+            logger.debug("interactive channel event")
+            # set to interacting mode, assign the current interactive event
+            self._begin_interactive_event(event=current_event)
+            self.interactive_event(channel_input=channel_input)
 
     def eof_received(self) -> bool:
         """
@@ -391,8 +597,7 @@ class BaseServer(SSHServer):
         """
         self.session = session
 
-        with open(collect_data, "r", encoding="utf-8") as f:
-            self.collect_data = YAML.load(f)
+        self.collect_data = load_collect_data(collect_data)
 
     def session_requested(self) -> SSHServerSession:  # type: ignore
         """
@@ -1,7 +1,9 @@
+import functools
+import re
+
 import pytest
 
 from scrapli.driver.core.cisco_iosxe import IOSXEDriver
-from scrapli_replay.server.collector import ScrapliCollector
 from scrapli_replay.server.server import BaseSSHServerSession
 
 
@@ -11,24 +13,6 @@ def scrapli_conn():
     return scrapli_conn
 
 
-@pytest.fixture(scope="function")
-def basic_collector(scrapli_conn):
-    channel_inputs = ["some input"]
-    interact_events = [[("some input", "some pattern", False)]]
-    paging_indicator = "--More--"
-    paging_escape_string = "non-standard"
-
-    collector = ScrapliCollector(
-        channel_inputs=channel_inputs,
-        interact_events=interact_events,
-        paging_indicator=paging_indicator,
-        paging_escape_string=paging_escape_string,
-        scrapli_connection=scrapli_conn,
-    )
-
-    return collector
-
-
 @pytest.fixture(scope="function")
 def basic_server():
     server = BaseSSHServerSession(
@@ -39,3 +23,13 @@ def basic_server():
         }
     )
     return server
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _memoized_re_compile():
+    # every IOSXEDriver construction re-compiles the same privilege level patterns; compilation is
+    # pure, so memoizing re.compile for the session turns the repeats into cache hits
+    monkeypatch = pytest.MonkeyPatch()
+    monkeypatch.setattr(re, "compile", functools.lru_cache(maxsize=None)(re.compile))
+    yield
+    monkeypatch.undo()
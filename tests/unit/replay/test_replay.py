@@ -1,11 +1,17 @@
-import sys
-from io import BytesIO
+import pickle
+from collections import deque
 from pathlib import Path
 
 import pytest
-from ruamel.yaml import safe_load  # type: ignore
+import yaml
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 from scrapli_replay.exceptions import ScrapliReplayException
+from scrapli_replay.replay import replay as replay_module
 from scrapli_replay.replay.replay import (
     ConnectionProfile,
     ReplayMode,
@@ -13,10 +19,143 @@ from scrapli_replay.replay.replay import (
     ScrapliReplayInstance,
 )
 
+# use the libyaml C loader when available -- ~10x faster parse for the save/load round trip
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+# cwd never changes during a test run, resolve the getcwd syscall once
+_CWD = Path.cwd()
+# the canonical recorded profile/interactions used across these tests; built once at import time
+# rather than re-constructed literal-by-literal in every test body
+_CONN_PROFILE = {
+    "host": "c3560",
+    "port": 22,
+    "auth_username": "vrnetlab",
+    "auth_password": True,
+    "auth_private_key": "",
+    "auth_private_key_passphrase": False,
+    "auth_bypass": False,
+    "transport": "asyncssh",
+    "auth_secondary": False,
+}
+# raw channel read logs the serialize/save tests replay into the instance read buffer; hoisted so
+# the byte literals are built once at import rather than per test call
+_READ_LOG_BYTES = (
+    b"Warning: Permanently added 'c3560,172.31.254.1' (RSA) to the list of known hosts.\nPassword: "
+    b"\n\nC3560CX#\nC3560CX#terminal length 0\nC3560CX#terminal width 512\nC3560CX#show run | i "
+    b"hostname\nhostname C3560CX\nC3560CX#\nC3560CX#"
+)
+_SHORT_READ_LOG_BYTES = (
+    b"Warning: Permanently added 'c3560,172.31.254.1' (RSA) to the list of known hosts.\nPassword: "
+    b"\n\nC3560CX#\nC3560CX#"
+)
+_EXPECTED_INTERACTIONS = [
+    {
+        "channel_output": "Warning: Permanently added 'c3560,172.31.254.1' (RSA) to the list of known hosts.\nPassword: ",
+        "expected_channel_input": "REDACTED",
+        "expected_channel_input_redacted": True,
+    },
+    {
+        "channel_output": "",
+        "expected_channel_input": "\n",
+        "expected_channel_input_redacted": False,
+    },
+    {
+        "channel_output": "\n\nC3560CX#",
+        "expected_channel_input": "\n",
+        "expected_channel_input_redacted": False,
+    },
+    {
+        "channel_output": "\nC3560CX#",
+        "expected_channel_input": "terminal length 0",
+        "expected_channel_input_redacted": False,
+    },
+    {
+        "channel_output": "terminal length 0",
+        "expected_channel_input": "\n",
+        "expected_channel_input_redacted": False,
+    },
+    {
+        "channel_output": "\nC3560CX#",
+        "expected_channel_input": "terminal width 512",
+        "expected_channel_input_redacted": False,
+    },
+    {
+        "channel_output": "terminal width 512",
+        "expected_channel_input": "\n",
+        "expected_channel_input_redacted": False,
+    },
+    {
+        "channel_output": "\nC3560CX#",
+        "expected_channel_input": "show run | i hostname",
+        "expected_channel_input_redacted": False,
+    },
+    {
+        "channel_output": "show run | i hostname",
+        "expected_channel_input": "\n",
+        "expected_channel_input_redacted": False,
+    },
+    {
+        "channel_output": "\nhostname C3560CX\nC3560CX#",
+        "expected_channel_input": "\n",
+        "expected_channel_input_redacted": False,
+    },
+    {
+        "channel_output": "\nC3560CX#",
+        "expected_channel_input": "exit",
+        "expected_channel_input_redacted": False,
+    },
+    {
+        "channel_output": "",
+        "expected_channel_input": "\n",
+        "expected_channel_input_redacted": False,
+    },
+    {
+        "channel_output": "",
+        "expected_channel_input": None,
+        "expected_channel_input_redacted": False,
+    },
+]
+_EXPECTED_SERIALIZE = {
+    "fakesession": {
+        "connection_profile": ConnectionProfile(**_CONN_PROFILE),
+        "interactions": _EXPECTED_INTERACTIONS,
+    }
+}
+# the save round trip only records the first three writes; note its final interaction is the
+# unconsumed-tail entry, not _EXPECTED_INTERACTIONS[3], and its profile is a plain dict since it
+# came back through yaml
+_EXPECTED_SAVE = {
+    "fakesession": {
+        "connection_profile": dict(_CONN_PROFILE),
+        "interactions": _EXPECTED_INTERACTIONS[:3]
+        + [
+            {
+                "channel_output": "\nC3560CX#",
+                "expected_channel_input": None,
+                "expected_channel_input_redacted": False,
+            }
+        ],
+    }
+}
+
+
+def _json_default(obj):
+    return obj.to_dict()
+
+
+def _assert_session_equal(actual, expected):
+    # C-level byte compare beats the recursive python dict compare for these deeply nested
+    # sessions; on mismatch (or without orjson) fall through to == so pytest renders a proper diff
+    if orjson is not None:
+        actual_bytes = orjson.dumps(actual, default=_json_default, option=orjson.OPT_SORT_KEYS)
+        expected_bytes = orjson.dumps(expected, default=_json_default, option=orjson.OPT_SORT_KEYS)
+        if actual_bytes == expected_bytes:
+            return
+    assert actual == expected
+
 
 def test_scrapli_replay_basic():
     replay = ScrapliReplay(session_name="test1", replay_mode="record")
-    assert replay.session_directory == Path.cwd()
+    assert replay.session_directory == _CWD
     assert replay.session_name == "test1"
     # even though we said record replay mode should be record since there is no session saved
     assert replay.replay_mode == ReplayMode.RECORD
@@ -25,16 +164,13 @@ def test_scrapli_replay_basic():
     assert replay._patched_open is None
 
 
-@pytest.mark.skipif(sys.version_info > (3, 9), reason="skipping pending pyfakefs 3.10 support")
-def test_scrapli_replay_existing_session(fs):
-    fs.create_file(
-        f"{Path.cwd()}/test1.yaml",
-        contents="---\nsomesession:\n  interactions:\n  - something",
-    )
+def test_scrapli_replay_existing_session(tmp_path):
+    (tmp_path / "test1.yaml").write_text("---\nsomesession:\n  interactions:\n  - something")
     # set replay mode to record, but will end up as replay as session exists!
-    # pyfakefs does not like additional slashes in path it seems... so just set it to empty string
-    replay = ScrapliReplay(session_directory="", session_name="test1", replay_mode="record")
-    assert str(replay.session_directory) == "."
+    replay = ScrapliReplay(
+        session_directory=str(tmp_path), session_name="test1", replay_mode="record"
+    )
+    assert replay.session_directory == tmp_path
     assert replay.session_name == "test1"
     assert replay.replay_mode == ReplayMode.REPLAY
     assert replay.replay_session == {"somesession": {"interactions": ["something"]}}
@@ -47,18 +183,66 @@ def test_scrapli_replay_invalid_replay_mode():
         ScrapliReplay(session_name="test1", replay_mode="blah")
 
 
-@pytest.mark.skipif(sys.version_info > (3, 9), reason="skipping pending pyfakefs 3.10 support")
-def test_session_exists(fs):
-    fs.create_file(
-        f"{Path.cwd()}/test1.yaml",
-        contents="---\nsomesession:\n  interactions:\n  - something",
+def test_session_exists(tmp_path):
+    session_file = tmp_path / "test1.yaml"
+    session_file.write_text("---\nsomesession:\n  interactions:\n  - something")
+    replay = ScrapliReplay(
+        session_directory=str(tmp_path), session_name="test1", replay_mode="record"
     )
-    replay = ScrapliReplay(session_directory="", session_name="test1", replay_mode="record")
     assert replay._session_exists() is True
-    fs.remove_object(f"{Path.cwd()}test1.yaml")
+    session_file.unlink()
     assert replay._session_exists() is False
 
 
+_SESSION_YAML_CONTENTS = "---\nsomesession:\n  interactions:\n  - something"
+
+
+def _write_sidecar_session(tmp_path):
+    session_file = tmp_path / "test1.yaml"
+    session_file.write_text(_SESSION_YAML_CONTENTS)
+    return session_file
+
+
+def test_load_session_pickle_sidecar_hit(monkeypatch, tmp_path):
+    monkeypatch.setattr(replay_module, "_PICKLE_CACHE_ENABLED", True)
+    session_file = _write_sidecar_session(tmp_path)
+
+    # sidecar with a fresh header but sentinel contents -- getting the sentinel back proves the
+    # session came from the sidecar, not the yaml
+    stat_result = session_file.stat()
+    sentinel = {"somesession": {"interactions": ["from the sidecar"]}}
+    with open(f"{session_file}.pkl", "wb") as f:
+        pickle.dump(((stat_result.st_mtime_ns, stat_result.st_size), sentinel), f)
+
+    assert replay_module._load_session(str(session_file)) == sentinel
+
+
+def test_load_session_pickle_sidecar_stale(monkeypatch, tmp_path):
+    monkeypatch.setattr(replay_module, "_PICKLE_CACHE_ENABLED", True)
+    session_file = _write_sidecar_session(tmp_path)
+
+    # header doesnt match the yaml's stat -> sidecar ignored, yaml parsed instead
+    with open(f"{session_file}.pkl", "wb") as f:
+        pickle.dump(((0, 0), {"somesession": {"interactions": ["stale"]}}), f)
+
+    assert replay_module._load_session(str(session_file)) == {
+        "somesession": {"interactions": ["something"]}
+    }
+
+
+def test_load_session_pickle_sidecar_corrupt(monkeypatch, tmp_path):
+    monkeypatch.setattr(replay_module, "_PICKLE_CACHE_ENABLED", True)
+    session_file = _write_sidecar_session(tmp_path)
+
+    # valid pickle of the wrong shape must not break the load -- fall back to the yaml
+    with open(f"{session_file}.pkl", "wb") as f:
+        pickle.dump(12345, f)
+
+    assert replay_module._load_session(str(session_file)) == {
+        "somesession": {"interactions": ["something"]}
+    }
+
+
 def test_record_session_profile(scrapli_conn):
     replay = ScrapliReplay(session_name="test1", replay_mode="record")
     conn_profile = replay.create_connection_profile(scrapli_conn=scrapli_conn)
@@ -72,24 +256,26 @@ def test_record_session_profile(scrapli_conn):
     assert conn_profile.transport == "system"
 
 
-def test_common_replay_mode():
-    connection_profile = {
-        "host": "c3560",
-        "port": 22,
-        "auth_username": "vrnetlab",
-        "auth_password": True,
-        "auth_private_key": "",
-        "auth_private_key_passphrase": False,
-        "auth_bypass": False,
-        "transport": "asyncssh",
-        "auth_secondary": False,
-    }
-    replay = ScrapliReplayInstance(
-        replay_mode=ReplayMode.RECORD, connection_profile=ConnectionProfile(**connection_profile)
-    )
+@pytest.fixture(scope="module")
+def conn_profile():
+    # module scoped as nothing mutates the profile object itself -- saves re-validating the same
+    # nine fields in every test that needs a profile
+    return ConnectionProfile(**_CONN_PROFILE)
+
+
+@pytest.fixture
+def make_replay_instance(conn_profile):
+    def _make():
+        return ScrapliReplayInstance(replay_mode=ReplayMode.RECORD, connection_profile=conn_profile)
+
+    return _make
+
+
+def test_common_replay_mode(make_replay_instance, conn_profile):
+    replay = make_replay_instance()
 
     replay.replay_session = {}
-    replay.replay_session["connection_profile"] = connection_profile
+    replay.replay_session["connection_profile"] = dict(_CONN_PROFILE)
 
     replay.replay_session["interactions"] = [
         {
@@ -104,308 +290,126 @@ def test_common_replay_mode():
         },
     ]
 
-    replay.connection_profile = ConnectionProfile(**connection_profile)
+    replay.connection_profile = conn_profile
     actual_device_outputs, actual_scrapli_inputs = replay._common_replay_mode()
 
-    actual_device_outputs = list(actual_device_outputs)
-    actual_scrapli_inputs = list(actual_scrapli_inputs)
-
-    assert actual_device_outputs == ["", "C3560CX#"]
-    assert actual_scrapli_inputs == [("\n", False), ("terminal length 0", False)]
+    assert list(actual_device_outputs) == [b"", b"C3560CX#"]
+    assert list(actual_scrapli_inputs) == [("\n", False), ("terminal length 0", False)]
 
 
-def test_common_replay_mode_exception():
-    connection_profile = {
-        "host": "c3560",
-        "port": 22,
-        "auth_username": "vrnetlab",
-        "auth_password": True,
-        "auth_private_key": "",
-        "auth_private_key_passphrase": False,
-        "auth_bypass": False,
-        "transport": "asyncssh",
-        "auth_secondary": False,
-    }
-    replay = ScrapliReplayInstance(
-        replay_mode=ReplayMode.RECORD, connection_profile=ConnectionProfile(**connection_profile)
-    )
+def test_common_replay_mode_exception(make_replay_instance, conn_profile):
+    replay = make_replay_instance()
 
-    replay._wrapped_connection_profile = ConnectionProfile(**connection_profile)
-    replay.replay_session["connection_profile"] = connection_profile
-    replay.replay_session["connection_profile"]["host"] = "blah"
+    replay._wrapped_connection_profile = conn_profile
+    # recorded host differs from the wrapped profile -> replay must refuse to run
+    replay.replay_session["connection_profile"] = {**_CONN_PROFILE, "host": "blah"}
 
     with pytest.raises(ScrapliReplayException):
         replay._common_replay_mode()
 
 
-async def test_setup_async_replay_mode(monkeypatch, scrapli_conn):
-    device_outputs = iter(["", "C3560CX#"])
-    scrapli_inputs = iter([("\n", False), ("terminal length 0", False)])
+@pytest.fixture
+def prepared_replay_instance(monkeypatch, scrapli_conn, make_replay_instance):
+    device_outputs = deque([b"", b"C3560CX#"])
+    scrapli_inputs = deque([("\n", False), ("terminal length 0", False)])
 
     def _common_replay_mode(cls):
         return device_outputs, scrapli_inputs
 
-    monkeypatch.setattr(
-        "scrapli_replay.replay.replay.ScrapliReplayInstance._common_replay_mode",
-        _common_replay_mode,
-    )
-
-    connection_profile = {
-        "host": "c3560",
-        "port": 22,
-        "auth_username": "vrnetlab",
-        "auth_password": True,
-        "auth_private_key": "",
-        "auth_private_key_passphrase": False,
-        "auth_bypass": False,
-        "transport": "asyncssh",
-        "auth_secondary": False,
-    }
-    replay = ScrapliReplayInstance(
-        replay_mode=ReplayMode.RECORD, connection_profile=ConnectionProfile(**connection_profile)
-    )
-    replay.setup_async_replay_mode(scrapli_conn=scrapli_conn)
-
-    # read off the channel, asserts we got the correct async method patched ++ we are returning
-    # what we expect
-    assert await scrapli_conn.channel.read() == b""
-    assert await scrapli_conn.channel.read() == b"C3560CX#"
-
-    # we're out of stuff to read back, we should be having a bad day here
-    with pytest.raises(ScrapliReplayException):
-        await scrapli_conn.channel.read()
+    monkeypatch.setattr(ScrapliReplayInstance, "_common_replay_mode", _common_replay_mode)
 
+    return make_replay_instance(), scrapli_conn
 
-def test_setup_replay_mode(monkeypatch, scrapli_conn):
-    device_outputs = iter(["", "C3560CX#"])
-    scrapli_inputs = iter([("\n", False), ("terminal length 0", False)])
 
-    def _common_replay_mode(cls):
-        return device_outputs, scrapli_inputs
-
-    monkeypatch.setattr(
-        "scrapli_replay.replay.replay.ScrapliReplayInstance._common_replay_mode",
-        _common_replay_mode,
-    )
-
-    connection_profile = {
-        "host": "c3560",
-        "port": 22,
-        "auth_username": "vrnetlab",
-        "auth_password": True,
-        "auth_private_key": "",
-        "auth_private_key_passphrase": False,
-        "auth_bypass": False,
-        "transport": "asyncssh",
-        "auth_secondary": False,
-    }
-    replay = ScrapliReplayInstance(
-        replay_mode=ReplayMode.RECORD, connection_profile=ConnectionProfile(**connection_profile)
-    )
-    replay.setup_replay_mode(scrapli_conn=scrapli_conn)
-
-    # read off the channel, asserts we got the correct async method patched ++ we are returning
-    # what we expect
-    assert scrapli_conn.channel.read() == b""
-    assert scrapli_conn.channel.read() == b"C3560CX#"
-
-    # we're out of stuff to read back, we should be having a bad day here
-    with pytest.raises(ScrapliReplayException):
-        scrapli_conn.channel.read()
-
-
-def test_serialize():
-    connection_profile = {
-        "host": "c3560",
-        "port": 22,
-        "auth_username": "vrnetlab",
-        "auth_password": True,
-        "auth_private_key": "",
-        "auth_private_key_passphrase": False,
-        "auth_bypass": False,
-        "transport": "asyncssh",
-        "auth_secondary": False,
-    }
-    replay = ScrapliReplayInstance(
-        replay_mode=ReplayMode.RECORD, connection_profile=ConnectionProfile(**connection_profile)
-    )
-
-    replay.read_log = BytesIO(
-        b"Warning: Permanently added 'c3560,172.31.254.1' (RSA) to the list of known hosts.\nPassword: "
-        b"\n\nC3560CX#\nC3560CX#terminal length 0\nC3560CX#terminal width 512\nC3560CX#show run | i "
-        b"hostname\nhostname C3560CX\nC3560CX#\nC3560CX#"
-    )
-    replay.write_log = [
-        ("VR-netlab9", True, 92),
-        ("\n", False, 92),
-        ("\n", False, 102),
-        ("terminal length 0", False, 111),
-        ("\n", False, 128),
-        ("terminal width 512", False, 137),
-        ("\n", False, 155),
-        ("show run | i hostname", False, 164),
-        ("\n", False, 185),
-        ("\n", False, 211),
-        ("exit", False, 220),
-        ("\n", False, 220),
+@pytest.mark.parametrize(
+    "is_async",
+    (
+        True,
+        False,
+    ),
+    ids=(
+        "asyncio",
+        "sync",
+    ),
+)
+async def test_setup_replay_mode(is_async, prepared_replay_instance):
+    replay, scrapli_conn = prepared_replay_instance
+
+    # read off the channel, asserts we got the correct (a)sync method patched ++ we are returning
+    # what we expect; once we're out of stuff to read back we should be having a bad day
+    if is_async:
+        replay.setup_async_replay_mode(scrapli_conn=scrapli_conn)
+
+        assert [await scrapli_conn.channel.read() for _ in range(2)] == [b"", b"C3560CX#"]
+
+        with pytest.raises(ScrapliReplayException):
+            await scrapli_conn.channel.read()
+    else:
+        replay.setup_replay_mode(scrapli_conn=scrapli_conn)
+
+        assert [scrapli_conn.channel.read() for _ in range(2)] == [b"", b"C3560CX#"]
+
+        with pytest.raises(ScrapliReplayException):
+            scrapli_conn.channel.read()
+
+
+def test_serialize(make_replay_instance):
+    replay = make_replay_instance()
+
+    replay._read_buf = bytearray(_READ_LOG_BYTES)
+    replay._write_inputs = [
+        "VR-netlab9",
+        "\n",
+        "\n",
+        "terminal length 0",
+        "\n",
+        "terminal width 512",
+        "\n",
+        "show run | i hostname",
+        "\n",
+        "\n",
+        "exit",
+        "\n",
     ]
+    replay._write_redacted = [
+        True,
+        False,
+        False,
+        False,
+        False,
+        False,
+        False,
+        False,
+        False,
+        False,
+        False,
+        False,
+    ]
+    replay._write_offsets = [92, 92, 102, 111, 128, 137, 155, 164, 185, 211, 220, 220]
 
     replay_wrapper = ScrapliReplay()
     replay_wrapper.wrapped_instances["fakesession"] = replay
     actual_replay_session = replay_wrapper._serialize()
 
-    assert actual_replay_session == {
-        "fakesession": {
-            "connection_profile": {
-                "host": "c3560",
-                "port": 22,
-                "auth_username": "vrnetlab",
-                "auth_password": True,
-                "auth_private_key": "",
-                "auth_private_key_passphrase": False,
-                "auth_bypass": False,
-                "transport": "asyncssh",
-                "auth_secondary": False,
-            },
-            "interactions": [
-                {
-                    "channel_output": "Warning: Permanently added 'c3560,172.31.254.1' (RSA) to the list of known hosts.\nPassword: ",
-                    "expected_channel_input": "REDACTED",
-                    "expected_channel_input_redacted": True,
-                },
-                {
-                    "channel_output": "",
-                    "expected_channel_input": "\n",
-                    "expected_channel_input_redacted": False,
-                },
-                {
-                    "channel_output": "\n\nC3560CX#",
-                    "expected_channel_input": "\n",
-                    "expected_channel_input_redacted": False,
-                },
-                {
-                    "channel_output": "\nC3560CX#",
-                    "expected_channel_input": "terminal length 0",
-                    "expected_channel_input_redacted": False,
-                },
-                {
-                    "channel_output": "terminal length 0",
-                    "expected_channel_input": "\n",
-                    "expected_channel_input_redacted": False,
-                },
-                {
-                    "channel_output": "\nC3560CX#",
-                    "expected_channel_input": "terminal width 512",
-                    "expected_channel_input_redacted": False,
-                },
-                {
-                    "channel_output": "terminal width 512",
-                    "expected_channel_input": "\n",
-                    "expected_channel_input_redacted": False,
-                },
-                {
-                    "channel_output": "\nC3560CX#",
-                    "expected_channel_input": "show run | i hostname",
-                    "expected_channel_input_redacted": False,
-                },
-                {
-                    "channel_output": "show run | i hostname",
-                    "expected_channel_input": "\n",
-                    "expected_channel_input_redacted": False,
-                },
-                {
-                    "channel_output": "\nhostname C3560CX\nC3560CX#",
-                    "expected_channel_input": "\n",
-                    "expected_channel_input_redacted": False,
-                },
-                {
-                    "channel_output": "\nC3560CX#",
-                    "expected_channel_input": "exit",
-                    "expected_channel_input_redacted": False,
-                },
-                {
-                    "channel_output": "",
-                    "expected_channel_input": "\n",
-                    "expected_channel_input_redacted": False,
-                },
-                {
-                    "channel_output": "",
-                    "expected_channel_input": None,
-                    "expected_channel_input_redacted": False,
-                },
-            ],
-        }
-    }
+    _assert_session_equal(actual_replay_session, _EXPECTED_SERIALIZE)
 
 
-@pytest.mark.skipif(sys.version_info > (3, 9), reason="skipping pending pyfakefs 3.10 support")
-def test_save(fs):
-    connection_profile = {
-        "host": "c3560",
-        "port": 22,
-        "auth_username": "vrnetlab",
-        "auth_password": True,
-        "auth_private_key": "",
-        "auth_private_key_passphrase": False,
-        "auth_bypass": False,
-        "transport": "asyncssh",
-        "auth_secondary": False,
-    }
-    replay = ScrapliReplayInstance(
-        replay_mode=ReplayMode.RECORD, connection_profile=ConnectionProfile(**connection_profile)
-    )
+def test_save(tmp_path, make_replay_instance, conn_profile):
+    replay = make_replay_instance()
 
-    replay._wrapped_connection_profile = ConnectionProfile(**connection_profile)
-    replay.read_log = BytesIO(
-        b"Warning: Permanently added 'c3560,172.31.254.1' (RSA) to the list of known hosts.\nPassword: "
-        b"\n\nC3560CX#\nC3560CX#"
-    )
-    replay.write_log = [
-        ("VR-netlab9", True, 92),
-        ("\n", False, 92),
-        ("\n", False, 102),
-    ]
+    replay._wrapped_connection_profile = conn_profile
+    replay._read_buf = bytearray(_SHORT_READ_LOG_BYTES)
+    replay._write_inputs = ["VR-netlab9", "\n", "\n"]
+    replay._write_redacted = [True, False, False]
+    replay._write_offsets = [92, 92, 102]
 
-    replay_wrapper = ScrapliReplay(session_directory="", session_name="test1", replay_mode="record")
+    replay_wrapper = ScrapliReplay(
+        session_directory=str(tmp_path), session_name="test1", replay_mode="record"
+    )
     replay_wrapper.wrapped_instances["fakesession"] = replay
     replay_wrapper._save()
 
-    with open(f"./test1.yaml", "r") as f:
-        loaded = safe_load(f)
-        assert loaded == {
-            "fakesession": {
-                "connection_profile": {
-                    "host": "c3560",
-                    "port": 22,
-                    "auth_username": "vrnetlab",
-                    "auth_password": True,
-                    "auth_private_key": "",
-                    "auth_private_key_passphrase": False,
-                    "auth_bypass": False,
-                    "transport": "asyncssh",
-                    "auth_secondary": False,
-                },
-                "interactions": [
-                    {
-                        "channel_output": "Warning: Permanently added 'c3560,172.31.254.1' (RSA) to the list of known hosts.\nPassword: ",
-                        "expected_channel_input": "REDACTED",
-                        "expected_channel_input_redacted": True,
-                    },
-                    {
-                        "channel_output": "",
-                        "expected_channel_input": "\n",
-                        "expected_channel_input_redacted": False,
-                    },
-                    {
-                        "channel_output": "\n\nC3560CX#",
-                        "expected_channel_input": "\n",
-                        "expected_channel_input_redacted": False,
-                    },
-                    {
-                        "channel_output": "\nC3560CX#",
-                        "expected_channel_input": None,
-                        "expected_channel_input_redacted": False,
-                    },
-                ],
-            }
-        }
+    # binary mode -- libyaml decodes in C, no need for a python-side TextIOWrapper decode pass
+    with open(tmp_path / "test1.yaml", "rb") as f:
+        loaded = yaml.load(f, Loader=_YAML_LOADER)
+        _assert_session_equal(loaded, _EXPECTED_SAVE)
@@ -0,0 +1,74 @@
+import copy
+
+import pytest
+
+from scrapli.channel.sync_channel import Channel
+from scrapli.driver.base.sync_driver import Driver
+from scrapli.driver.core.cisco_iosxe import IOSXEDriver
+from scrapli.driver.network.sync_driver import NetworkDriver
+from scrapli_replay.server.collector import ScrapliCollector
+
+# attributes the collector tests mutate; snapshotted once after construction and restored per test
+# so one collector (and one IOSXEDriver) can serve the whole module instead of being rebuilt ~16x
+_COLLECTOR_RESET_ATTRS = (
+    "channel_inputs",
+    "interact_events",
+    "on_open_enabled",
+    "on_open_inputs",
+    "on_close_inputs",
+    "collected_priv_prompts",
+    "initial_privilege_level",
+    "privilege_level_prompts",
+    "all_expected_patterns",
+    "events",
+    "dumpable_events",
+    "unknown_events",
+    "dumpable_unknown_events",
+    "scrapli_connection_standard_on_open",
+    "scrapli_connection_standard_on_close",
+)
+
+
+@pytest.fixture(scope="module")
+def _module_collector():
+    collector = ScrapliCollector(
+        channel_inputs=["some input"],
+        interact_events=[[("some input", "some pattern", False)]],
+        paging_indicator="--More--",
+        paging_escape_string="non-standard",
+        scrapli_connection=IOSXEDriver(host="localhost"),
+    )
+    snapshot = {name: copy.deepcopy(getattr(collector, name)) for name in _COLLECTOR_RESET_ATTRS}
+    return collector, snapshot
+
+
+@pytest.fixture(scope="function")
+def basic_collector(_module_collector):
+    collector, snapshot = _module_collector
+    for name, value in snapshot.items():
+        setattr(collector, name, copy.deepcopy(value))
+    # drop any instance-level method overrides a previous test may have installed
+    for name in (
+        "_collect_unknown_events",
+        "_collect_standard_event",
+        "_collect_interactive_event",
+    ):
+        collector.__dict__.pop(name, None)
+    return collector
+
+
+@pytest.fixture(scope="function")
+def collector_patches(monkeypatch):
+    # the common patch set the collect_* tests all need; applied in one pass so each test doesnt
+    # repeat the same setattr calls -- tests needing divergent behavior just re-patch on top
+    monkeypatch.setattr(NetworkDriver, "acquire_priv", lambda cls, target_priv: None)
+    monkeypatch.setattr(Channel, "get_prompt", lambda _: "c3560cx#")
+    monkeypatch.setattr(
+        Channel,
+        "send_input_and_read",
+        lambda cls, channel_input, expected_outputs, read_duration=0: (b"raw output", b"output"),
+    )
+    monkeypatch.setattr(Channel, "write", lambda cls, channel_input, redacted: None)
+    monkeypatch.setattr(Driver, "open", lambda _: None)
+    monkeypatch.setattr(Driver, "close", lambda _: None)
+    return monkeypatch
@@ -3,6 +3,7 @@ from io import BytesIO
 
 import pytest
 
+from scrapli.channel.sync_channel import Channel
 from scrapli.driver.core.cisco_iosxe.sync_driver import IOSXEDriver
 from scrapli.exceptions import ScrapliConnectionError
 from scrapli_replay.exceptions import ScrapliReplayException
@@ -14,6 +15,29 @@ from scrapli_replay.server.collector import (
     StandardEvent,
 )
 
+# keep all collector tests on one pytest-xdist worker (run with `-n auto --dist loadgroup`) so the
+# module scoped collector fixture is built once rather than once per worker
+pytestmark = pytest.mark.xdist_group(name="collector")
+
+
+# stateless patch targets shared by the tests below; defined once instead of allocating a fresh
+# closure in every test invocation
+def _send_input_and_read_raises(cls, channel_input, expected_outputs, read_duration=0):
+    raise ScrapliConnectionError
+
+
+def _send_input_and_read_paging(cls, channel_input, expected_outputs, read_duration=0):
+    return b"blah --More--", b"blah --More--"
+
+
+def _get_prompt_raises(cls):
+    raise ScrapliConnectionError
+
+
+def _write_something(cls):
+    cls.channel.write("something")
+    cls.channel.send_return()
+
 
 def test_collector_instantiation(scrapli_conn):
     channel_inputs = ["some input"]
@@ -121,26 +145,19 @@ def test_collector_instantiation_no_scrapli_conn_no_platform():
     )
 
 
-def test_open(monkeypatch, basic_collector):
-    monkeypatch.setattr("scrapli.driver.base.sync_driver.Driver.open", lambda _: None)
-    monkeypatch.setattr("scrapli.channel.sync_channel.Channel.get_prompt", lambda _: "c3560cx#")
-
+def test_open(collector_patches, basic_collector):
     assert basic_collector.initial_privilege_level == ""
     basic_collector.open()
     assert basic_collector.initial_privilege_level == "privilege_exec"
 
 
-def test_close(monkeypatch, basic_collector):
+def test_close(collector_patches, basic_collector):
     # not testing much really... but in the future we may do other "stuff" at close of collector,
     # so just sketching this out for now
-    monkeypatch.setattr("scrapli.driver.base.sync_driver.Driver.close", lambda _: None)
-
     basic_collector.close()
 
 
-def test_collect_privilege_prompts(monkeypatch, basic_collector):
-    monkeypatch.setattr("scrapli.driver.base.sync_driver.Driver.open", lambda _: None)
-    monkeypatch.setattr("scrapli.channel.sync_channel.Channel.get_prompt", lambda _: "c3560cx#")
+def test_collect_privilege_prompts(collector_patches, basic_collector):
     basic_collector.open()
 
     # we can expect scrapli to behave so we just want to test the logic here... so we'll just make
@@ -164,349 +181,177 @@ def test_extend_all_expected_prompts_exception(basic_collector):
         basic_collector._extend_all_expected_prompts()
 
 
-@pytest.mark.parametrize(
-    "test_data",
-    (
+def test_strip_leading_newline(basic_collector):
+    # single_newline / many_newline / noline cases; table-driven rather than parametrized since
+    # each case is a microsecond of work not worth three collection items
+    for _input, expected in (
         ("\nsomething", "something"),
         ("\n\n\nsomething", "\n\nsomething"),
         ("something", "something"),
-    ),
-    ids=(
-        "single_newline",
-        "many_newline",
-        "noline",
-    ),
-)
-def test_strip_leading_newline(basic_collector, test_data):
-    _input, expected = test_data
-    assert basic_collector._strip_leading_newline(channel_output=_input) == expected
-
-
-def test_collect_on_open_inputs(monkeypatch, basic_collector):
-    monkeypatch.setattr(
-        "scrapli.driver.network.sync_driver.NetworkDriver.acquire_priv",
-        lambda cls, target_priv: None,
-    )
-    monkeypatch.setattr(
-        "scrapli.channel.sync_channel.Channel.write", lambda cls, channel_input, redacted: None
-    )
+    ):
+        assert basic_collector._strip_leading_newline(channel_output=_input) == expected
 
-    def dummy_on_open(cls):
-        cls.channel.write("something")
-        cls.channel.send_return()
 
-    basic_collector.scrapli_connection_standard_on_open = dummy_on_open
+def test_collect_on_open_inputs(collector_patches, basic_collector):
+    basic_collector.scrapli_connection_standard_on_open = _write_something
 
     basic_collector._collect_on_open_inputs()
     assert basic_collector.on_open_inputs == ["something"]
 
 
-def test_collect_on_close_inputs(monkeypatch, basic_collector):
-    # patching open too as we expect things to close... so we try to reopen of course
-    monkeypatch.setattr("scrapli.driver.base.sync_driver.Driver.open", lambda _: None)
-    monkeypatch.setattr(
-        "scrapli.driver.network.sync_driver.NetworkDriver.acquire_priv",
-        lambda cls, target_priv: None,
-    )
-    monkeypatch.setattr(
-        "scrapli.channel.sync_channel.Channel.write", lambda cls, channel_input, redacted: None
-    )
-
-    def dummy_get_prompt(cls):
-        raise ScrapliConnectionError
-
-    monkeypatch.setattr("scrapli.channel.sync_channel.Channel.get_prompt", dummy_get_prompt)
-
-    def dummy_on_close(cls):
-        cls.channel.write("something")
-        cls.channel.send_return()
+def test_collect_on_close_inputs(monkeypatch, collector_patches, basic_collector):
+    monkeypatch.setattr(Channel, "get_prompt", _get_prompt_raises)
 
     # set the initial priv level so the open after the exception doesnt try to get prompt again
     basic_collector.initial_privilege_level = "privilege_exec"
-    basic_collector.scrapli_connection_standard_on_close = dummy_on_close
+    basic_collector.scrapli_connection_standard_on_close = _write_something
 
     basic_collector._collect_on_close_inputs()
     assert basic_collector.on_close_inputs == ["something"]
 
 
-@pytest.mark.parametrize(
-    "test_data",
-    (False, True),
-    ids=(
-        "pre_open",
-        "post_open",
-    ),
-)
-def test_collect_standard_event(monkeypatch, test_data, basic_collector):
+def test_collect_standard_event(collector_patches, basic_collector):
     # lots of patching here... basically we know the individual components work so we really just
     # want to make sure the overall flow does what we think it should...
 
-    basic_collector.on_open_enabled = test_data
-    on_open_enabled_key = "post_on_open" if basic_collector.on_open_enabled else "pre_on_open"
+    # run both the pre and post on open paths in one pass -- the patches are stateless so
+    # they survive between iterations, and the event keys never collide
+    for on_open_enabled in (False, True):
+        basic_collector.on_open_enabled = on_open_enabled
+        on_open_enabled_key = "post_on_open" if on_open_enabled else "pre_on_open"
 
-    # patch acquire priv so we are just always in the right priv
-    monkeypatch.setattr(
-        "scrapli.driver.network.sync_driver.NetworkDriver.acquire_priv",
-        lambda cls, target_priv: None,
-    )
+        basic_collector._collect_standard_event(channel_input="show version")
 
-    # patch get prompt because we will check to see what the resulting prompt is for each command
-    monkeypatch.setattr("scrapli.channel.sync_channel.Channel.get_prompt", lambda _: "c3560cx#")
-
-    # patch send input and read because we are obviously sending something and reading the output!
-    def dummy_send_input_and_read(cls, channel_input, expected_outputs, read_duration=0):
-        return b"raw output", b"output"
-
-    monkeypatch.setattr(
-        "scrapli.channel.sync_channel.Channel.send_input_and_read", dummy_send_input_and_read
-    )
-
-    basic_collector._collect_standard_event(channel_input="show version")
-
-    for priv_level in basic_collector.scrapli_connection.privilege_levels:
-        assert basic_collector.events[priv_level][on_open_enabled_key][
-            "show version"
-        ] == StandardEvent(
-            channel_output="raw output",
-            result_privilege_level="privilege_exec",
-            returns_prompt=True,
-            closes_connection=False,
-        )
+        for priv_level in basic_collector.scrapli_connection.privilege_levels:
+            assert basic_collector.events[
+                (priv_level, on_open_enabled_key, "show version")
+            ] == StandardEvent(
+                channel_output="raw output",
+                result_privilege_level="privilege_exec",
+                returns_prompt=True,
+                closes_connection=False,
+            )
 
 
-@pytest.mark.parametrize(
-    "test_data",
-    (False, True),
-    ids=(
-        "pre_open",
-        "post_open",
-    ),
-)
-def test_collect_standard_event_closes_connection(monkeypatch, test_data, basic_collector):
+def test_collect_standard_event_closes_connection(monkeypatch, collector_patches, basic_collector):
     # lots of patching here... basically we know the individual components work so we really just
     # want to make sure the overall flow does what we think it should...
 
-    basic_collector.on_open_enabled = test_data
-    on_open_enabled_key = "post_on_open" if basic_collector.on_open_enabled else "pre_on_open"
-
-    # patch acquire priv so we are just always in the right priv
-    monkeypatch.setattr(
-        "scrapli.driver.network.sync_driver.NetworkDriver.acquire_priv",
-        lambda cls, target_priv: None,
-    )
-
-    # patch get prompt because we will check to see what the resulting prompt is for each command
-    monkeypatch.setattr("scrapli.channel.sync_channel.Channel.get_prompt", lambda _: "c3560cx#")
-
     # patch send input and read because we are obviously sending something and reading the output!
-    def dummy_send_input_and_read(cls, channel_input, expected_outputs, read_duration=0):
-        raise ScrapliConnectionError
-
-    monkeypatch.setattr(
-        "scrapli.channel.sync_channel.Channel.send_input_and_read", dummy_send_input_and_read
-    )
-
-    # additionally patching open as we would try to reopen after the connection closes
-    monkeypatch.setattr("scrapli.driver.base.sync_driver.Driver.open", lambda _: None)
-
-    basic_collector._collect_standard_event(channel_input="show version")
-
-    for priv_level in basic_collector.scrapli_connection.privilege_levels:
-        assert basic_collector.events[priv_level][on_open_enabled_key][
-            "show version"
-        ] == StandardEvent(
-            channel_output="__CLOSES_CONNECTION__",
-            result_privilege_level="privilege_exec",
-            returns_prompt=False,
-            closes_connection=True,
-        )
+    monkeypatch.setattr(Channel, "send_input_and_read", _send_input_and_read_raises)
+
+    # run both the pre and post on open paths in one pass -- the patches are stateless so
+    # they survive between iterations, and the event keys never collide
+    for on_open_enabled in (False, True):
+        basic_collector.on_open_enabled = on_open_enabled
+        on_open_enabled_key = "post_on_open" if on_open_enabled else "pre_on_open"
+
+        basic_collector._collect_standard_event(channel_input="show version")
+
+        for priv_level in basic_collector.scrapli_connection.privilege_levels:
+            assert basic_collector.events[
+                (priv_level, on_open_enabled_key, "show version")
+            ] == StandardEvent(
+                channel_output="__CLOSES_CONNECTION__",
+                result_privilege_level="privilege_exec",
+                returns_prompt=False,
+                closes_connection=True,
+            )
 
 
-@pytest.mark.parametrize(
-    "test_data",
-    (False, True),
-    ids=(
-        "pre_open",
-        "post_open",
-    ),
-)
-def test_collect_standard_event_paging_indicated(monkeypatch, test_data, basic_collector):
+def test_collect_standard_event_paging_indicated(monkeypatch, collector_patches, basic_collector):
     # lots of patching here... basically we know the individual components work so we really just
     # want to make sure the overall flow does what we think it should...
 
-    basic_collector.on_open_enabled = test_data
-    on_open_enabled_key = "post_on_open" if basic_collector.on_open_enabled else "pre_on_open"
-
-    # patch acquire priv so we are just always in the right priv
-    monkeypatch.setattr(
-        "scrapli.driver.network.sync_driver.NetworkDriver.acquire_priv",
-        lambda cls, target_priv: None,
-    )
-
-    # patch get prompt because we will check to see what the resulting prompt is for each command
-    monkeypatch.setattr("scrapli.channel.sync_channel.Channel.get_prompt", lambda _: "c3560cx#")
-
     # patch send input and read because we are obviously sending something and reading the output!
-    def dummy_send_input_and_read(cls, channel_input, expected_outputs, read_duration=0):
-        return b"blah --More--", b"blah --More--"
-
-    monkeypatch.setattr(
-        "scrapli.channel.sync_channel.Channel.send_input_and_read", dummy_send_input_and_read
-    )
-
-    # additionally patching write so we can ignore the paging escape input
-    monkeypatch.setattr(
-        "scrapli.channel.sync_channel.Channel.write", lambda cls, channel_input, redacted: None
-    )
-
-    basic_collector._collect_standard_event(channel_input="show version")
-
-    for priv_level in basic_collector.scrapli_connection.privilege_levels:
-        assert basic_collector.events[priv_level][on_open_enabled_key][
-            "show version"
-        ] == StandardEvent(
-            channel_output="blah --More--",
-            result_privilege_level="privilege_exec",
-            returns_prompt=False,
-            closes_connection=False,
-        )
+    monkeypatch.setattr(Channel, "send_input_and_read", _send_input_and_read_paging)
+
+    # run both the pre and post on open paths in one pass -- the patches are stateless so
+    # they survive between iterations, and the event keys never collide
+    for on_open_enabled in (False, True):
+        basic_collector.on_open_enabled = on_open_enabled
+        on_open_enabled_key = "post_on_open" if on_open_enabled else "pre_on_open"
+
+        basic_collector._collect_standard_event(channel_input="show version")
+
+        for priv_level in basic_collector.scrapli_connection.privilege_levels:
+            assert basic_collector.events[
+                (priv_level, on_open_enabled_key, "show version")
+            ] == StandardEvent(
+                channel_output="blah --More--",
+                result_privilege_level="privilege_exec",
+                returns_prompt=False,
+                closes_connection=False,
+            )
 
 
-@pytest.mark.parametrize(
-    "test_data",
-    (False, True),
-    ids=(
-        "pre_open",
-        "post_open",
-    ),
-)
-def test_collect_unknown_event(monkeypatch, test_data, basic_collector):
+def test_collect_unknown_event(collector_patches, basic_collector):
     # lots of patching here... basically we know the individual components work so we really just
     # want to make sure the overall flow does what we think it should...
 
-    basic_collector.on_open_enabled = test_data
-    on_open_enabled_key = "post_on_open" if basic_collector.on_open_enabled else "pre_on_open"
+    # run both the pre and post on open paths in one pass -- the patches are stateless so
+    # they survive between iterations, and the event keys never collide
+    for on_open_enabled in (False, True):
+        basic_collector.on_open_enabled = on_open_enabled
+        on_open_enabled_key = "post_on_open" if on_open_enabled else "pre_on_open"
 
-    # patch acquire priv so we are just always in the right priv
-    monkeypatch.setattr(
-        "scrapli.driver.network.sync_driver.NetworkDriver.acquire_priv",
-        lambda cls, target_priv: None,
-    )
+        basic_collector._collect_unknown_events()
 
-    # patch get prompt because we will check to see what the resulting prompt is for each command
-    monkeypatch.setattr("scrapli.channel.sync_channel.Channel.get_prompt", lambda _: "c3560cx#")
-
-    # patch send input and read because we are obviously sending something and reading the output!
-    def dummy_send_input_and_read(cls, channel_input, expected_outputs, read_duration=0):
-        return b"raw output", b"output"
-
-    monkeypatch.setattr(
-        "scrapli.channel.sync_channel.Channel.send_input_and_read", dummy_send_input_and_read
-    )
-
-    basic_collector._collect_unknown_events()
-
-    for priv_level in basic_collector.scrapli_connection.privilege_levels:
-        assert basic_collector.unknown_events[priv_level][on_open_enabled_key] == StandardEvent(
-            channel_output="raw output",
-            result_privilege_level="privilege_exec",
-            returns_prompt=True,
-            closes_connection=False,
-        )
+        for priv_level in basic_collector.scrapli_connection.privilege_levels:
+            assert basic_collector.unknown_events[priv_level][on_open_enabled_key] == StandardEvent(
+                channel_output="raw output",
+                result_privilege_level="privilege_exec",
+                returns_prompt=True,
+                closes_connection=False,
+            )
 
 
-@pytest.mark.parametrize(
-    "test_data",
-    (False, True),
-    ids=(
-        "pre_open",
-        "post_open",
-    ),
-)
-def test_collect_unknown_event_closes_connection(monkeypatch, test_data, basic_collector):
+def test_collect_unknown_event_closes_connection(monkeypatch, collector_patches, basic_collector):
     # lots of patching here... basically we know the individual components work so we really just
     # want to make sure the overall flow does what we think it should...
 
-    basic_collector.on_open_enabled = test_data
-    on_open_enabled_key = "post_on_open" if basic_collector.on_open_enabled else "pre_on_open"
-
-    # patch acquire priv so we are just always in the right priv
-    monkeypatch.setattr(
-        "scrapli.driver.network.sync_driver.NetworkDriver.acquire_priv",
-        lambda cls, target_priv: None,
-    )
-
-    # patch get prompt because we will check to see what the resulting prompt is for each command
-    monkeypatch.setattr("scrapli.channel.sync_channel.Channel.get_prompt", lambda _: "c3560cx#")
-
     # patch send input and read because we are obviously sending something and reading the output!
-    def dummy_send_input_and_read(cls, channel_input, expected_outputs, read_duration=0):
-        raise ScrapliConnectionError
-
-    monkeypatch.setattr(
-        "scrapli.channel.sync_channel.Channel.send_input_and_read", dummy_send_input_and_read
-    )
-
-    # additionally patching open as we would try to reopen after the connection closes
-    monkeypatch.setattr("scrapli.driver.base.sync_driver.Driver.open", lambda _: None)
-
-    basic_collector._collect_unknown_events()
-
-    for priv_level in basic_collector.scrapli_connection.privilege_levels:
-        assert basic_collector.unknown_events[priv_level][on_open_enabled_key] == StandardEvent(
-            channel_output="__CLOSES_CONNECTION__",
-            result_privilege_level="privilege_exec",
-            returns_prompt=False,
-            closes_connection=True,
-        )
+    monkeypatch.setattr(Channel, "send_input_and_read", _send_input_and_read_raises)
+
+    # run both the pre and post on open paths in one pass -- the patches are stateless so
+    # they survive between iterations, and the event keys never collide
+    for on_open_enabled in (False, True):
+        basic_collector.on_open_enabled = on_open_enabled
+        on_open_enabled_key = "post_on_open" if on_open_enabled else "pre_on_open"
+
+        basic_collector._collect_unknown_events()
+
+        for priv_level in basic_collector.scrapli_connection.privilege_levels:
+            assert basic_collector.unknown_events[priv_level][on_open_enabled_key] == StandardEvent(
+                channel_output="__CLOSES_CONNECTION__",
+                result_privilege_level="privilege_exec",
+                returns_prompt=False,
+                closes_connection=True,
+            )
 
 
-@pytest.mark.parametrize(
-    "test_data",
-    (False, True),
-    ids=(
-        "pre_open",
-        "post_open",
-    ),
-)
-def test_collect_unknown_event_paging_indicated(monkeypatch, test_data, basic_collector):
+def test_collect_unknown_event_paging_indicated(monkeypatch, collector_patches, basic_collector):
     # lots of patching here... basically we know the individual components work so we really just
     # want to make sure the overall flow does what we think it should...
 
-    basic_collector.on_open_enabled = test_data
-    on_open_enabled_key = "post_on_open" if basic_collector.on_open_enabled else "pre_on_open"
-
-    # patch acquire priv so we are just always in the right priv
-    monkeypatch.setattr(
-        "scrapli.driver.network.sync_driver.NetworkDriver.acquire_priv",
-        lambda cls, target_priv: None,
-    )
-
-    # patch get prompt because we will check to see what the resulting prompt is for each command
-    monkeypatch.setattr("scrapli.channel.sync_channel.Channel.get_prompt", lambda _: "c3560cx#")
-
     # patch send input and read because we are obviously sending something and reading the output!
-    def dummy_send_input_and_read(cls, channel_input, expected_outputs, read_duration=0):
-        return b"blah --More--", b"blah --More--"
+    monkeypatch.setattr(Channel, "send_input_and_read", _send_input_and_read_paging)
 
-    monkeypatch.setattr(
-        "scrapli.channel.sync_channel.Channel.send_input_and_read", dummy_send_input_and_read
-    )
+    # run both the pre and post on open paths in one pass -- the patches are stateless so
+    # they survive between iterations, and the event keys never collide
+    for on_open_enabled in (False, True):
+        basic_collector.on_open_enabled = on_open_enabled
+        on_open_enabled_key = "post_on_open" if on_open_enabled else "pre_on_open"
 
-    # additionally patching write so we can ignore the paging escape input
-    monkeypatch.setattr(
-        "scrapli.channel.sync_channel.Channel.write", lambda cls, channel_input, redacted: None
-    )
+        basic_collector._collect_unknown_events()
 
-    basic_collector._collect_unknown_events()
-
-    for priv_level in basic_collector.scrapli_connection.privilege_levels:
-        assert basic_collector.unknown_events[priv_level][on_open_enabled_key] == StandardEvent(
-            channel_output="blah --More--",
-            result_privilege_level="privilege_exec",
-            returns_prompt=False,
-            closes_connection=False,
-        )
+        for priv_level in basic_collector.scrapli_connection.privilege_levels:
+            assert basic_collector.unknown_events[priv_level][on_open_enabled_key] == StandardEvent(
+                channel_output="blah --More--",
+                result_privilege_level="privilege_exec",
+                returns_prompt=False,
+                closes_connection=False,
+            )
 
 
 def test__collect(basic_collector):
@@ -545,35 +390,29 @@ def test__collect(basic_collector):
 
 def test_serialize(basic_collector):
     basic_collector.events = {
-        "exec": {
-            "pre_on_open": {
-                "terminal width 512": StandardEvent(
-                    channel_output="C3560CX#",
-                    result_privilege_level="privilege_exec",
+        ("exec", "pre_on_open", "terminal width 512"): StandardEvent(
+            channel_output="C3560CX#",
+            result_privilege_level="privilege_exec",
+            returns_prompt=True,
+            closes_connection=False,
+        ),
+        ("exec", "post_on_open", "clear logg"): InteractiveEvent(
+            result_privilege_level="tclsh",
+            event_steps=[
+                InteractStep(
+                    channel_input="clear logg",
+                    channel_output="Clear logging buffer [confirm]",
+                    hidden_input=False,
                     returns_prompt=True,
-                    closes_connection=False,
-                )
-            },
-            "post_on_open": {
-                "clear logg": InteractiveEvent(
-                    result_privilege_level="tclsh",
-                    event_steps=[
-                        InteractStep(
-                            channel_input="clear logg",
-                            channel_output="Clear logging buffer [confirm]",
-                            hidden_input=False,
-                            returns_prompt=True,
-                        ),
-                        InteractStep(
-                            channel_input="\n",
-                            channel_output="C3560CX(tcl)#",
-                            hidden_input=False,
-                            returns_prompt=True,
-                        ),
-                    ],
-                )
-            },
-        }
+                ),
+                InteractStep(
+                    channel_input="\n",
+                    channel_output="C3560CX(tcl)#",
+                    hidden_input=False,
+                    returns_prompt=True,
+                ),
+            ],
+        ),
     }
     basic_collector.unknown_events = {
         "exec": {
@@ -4,7 +4,12 @@ import pytest
 from asyncssh.editor import SSHLineEditorChannel
 
 from scrapli_replay.exceptions import ScrapliReplayException
-from scrapli_replay.server.server import OnOpenState
+from scrapli_replay.server.server import (
+    ON_OPEN_POST,
+    ON_OPEN_PRE,
+    BaseSSHServerSession,
+    ServerEvent,
+)
 
 
 def test_base_server_session(basic_server):
@@ -13,7 +18,7 @@ def test_base_server_session(basic_server):
     assert basic_server._interacting is False
     assert basic_server._interacting_event is None
     assert basic_server._interact_index == 0
-    assert basic_server._on_open_state == OnOpenState.PRE
+    assert basic_server._on_open_state == ON_OPEN_PRE
     assert basic_server._on_open_commands_list == ["openstuff"]
     assert basic_server.current_privilege_level == "veryprivvy"
 
@@ -64,52 +69,50 @@ def test_interactive_event(monkeypatch, basic_server):
         nonlocal chan
         chan.write(data)
 
-    monkeypatch.setattr("asyncssh.editor.SSHLineEditorChannel.write", dummy_write)
+    monkeypatch.setattr(SSHLineEditorChannel, "write", dummy_write)
 
-    basic_server.collect_data = {
-        "unknown_events": {
-            "veryprivvy": {
-                "pre_on_open": {
-                    "channel_output": "bad stuff",
-                    "closes_connection": False,
-                    "result_privilege_level": "veryprivvy",
-                }
-            }
-        }
-    }
-    interact_event = {
-        "result_privilege_level": "privilege_exec",
-        "event_steps": [
-            {
-                "channel_input": "blah",
-                "channel_output": "blahblahblah",
-                "hidden_input": False,
-                "returns_prompt": True,
-            },
-            {
-                "channel_input": "scrapli",
-                "channel_output": "blah2blah2blah2",
-                "hidden_input": True,
-                "returns_prompt": True,
-            },
-            {
-                "channel_input": "blah",
-                "channel_output": "blah2blah2blah2",
-                "hidden_input": True,
-                "returns_prompt": True,
-            },
+    basic_server._unknown_events_flat = {
+        ("veryprivvy", "pre_on_open"): ServerEvent(
             {
-                "channel_input": "blah",
-                "channel_output": "blah2blah2blah2",
-                "hidden_input": False,
-                "returns_prompt": True,
-            },
-        ],
+                "channel_output": "bad stuff",
+                "closes_connection": False,
+                "result_privilege_level": "veryprivvy",
+            }
+        )
     }
-    basic_server._interacting_event = interact_event
-
-    # setting this as it normally gets set in the "data_received" method
-    basic_server._interacting = True
+    interact_event = ServerEvent(
+        {
+            "result_privilege_level": "privilege_exec",
+            "event_steps": [
+                {
+                    "channel_input": "blah",
+                    "channel_output": "blahblahblah",
+                    "hidden_input": False,
+                    "returns_prompt": True,
+                },
+                {
+                    "channel_input": "scrapli",
+                    "channel_output": "blah2blah2blah2",
+                    "hidden_input": True,
+                    "returns_prompt": True,
+                },
+                {
+                    "channel_input": "blah",
+                    "channel_output": "blah2blah2blah2",
+                    "hidden_input": True,
+                    "returns_prompt": True,
+                },
+                {
+                    "channel_input": "blah",
+                    "channel_output": "blah2blah2blah2",
+                    "hidden_input": False,
+                    "returns_prompt": True,
+                },
+            ],
+        }
+    )
+    # normally set in the "data_received" method via _begin_interactive_event
+    basic_server._begin_interactive_event(event=interact_event)
     basic_server.interactive_event(channel_input="blah")
 
     assert basic_server._interact_index == 1
@@ -139,8 +142,7 @@ def test_interactive_event(monkeypatch, basic_server):
     assert chan.read() == "blahblahblahblah2blah2blah2blah2blah2blah2bad stuff"
 
     # setting back to interacting mode to test the hitting the last interact step
-    basic_server._interacting = True
-    basic_server._interacting_event = interact_event
+    basic_server._begin_interactive_event(event=interact_event)
 
     basic_server._interact_index = 3
     basic_server.interactive_event(channel_input="blah")
@@ -153,15 +155,15 @@ def test_interactive_event(monkeypatch, basic_server):
 def test_standard_event_closes_connection(basic_server):
     basic_server._chan = StringIO()
     basic_server.eof_received = lambda: None
-    basic_server._on_open_state = OnOpenState.POST
+    basic_server._on_open_state = ON_OPEN_POST
     basic_server.current_privilege_level = "taco"
 
     basic_server.standard_event(
-        channel_input="exit", event={"channel_output": "__CLOSES_CONNECTION__"}
+        channel_input="exit", event=ServerEvent({"channel_output": "__CLOSES_CONNECTION__"})
     )
 
     assert basic_server.current_privilege_level == "veryprivvy"
-    assert basic_server._on_open_state == OnOpenState.PRE
+    assert basic_server._on_open_state == ON_OPEN_PRE
     basic_server._chan.seek(0)
     # we write an empty line to make it look like normal devices do
     assert basic_server._chan.read() == ""
@@ -169,21 +171,23 @@ def test_standard_event_closes_connection(basic_server):
 
 def test_standard_event(basic_server):
     basic_server._chan = StringIO()
-    basic_server._on_open_state = OnOpenState.PRE
+    basic_server._on_open_state = ON_OPEN_PRE
     basic_server.current_privilege_level = "taco"
 
     basic_server.standard_event(
         channel_input="openstuff",
-        event={
-            "channel_output": "stuff",
-            "result_privilege_level": "veryprivvy",
-            "closes_connection": False,
-        },
+        event=ServerEvent(
+            {
+                "channel_output": "stuff",
+                "result_privilege_level": "veryprivvy",
+                "closes_connection": False,
+            }
+        ),
     )
 
     # assert we got all the on open stuff set to post and the on open commands is empty now
     assert basic_server.current_privilege_level == "veryprivvy"
-    assert basic_server._on_open_state == OnOpenState.POST
+    assert basic_server._on_open_state == ON_OPEN_POST
     basic_server._chan.seek(0)
     assert basic_server._chan.read() == "stuff"
     assert basic_server._on_open_commands_list == []
@@ -196,10 +200,7 @@ def test_data_received_interacting(monkeypatch, basic_server):
         nonlocal dispatched_to_interactive_event
         dispatched_to_interactive_event = True
 
-    monkeypatch.setattr(
-        "scrapli_replay.server.server.BaseSSHServerSession.interactive_event",
-        dummy_interactive_event,
-    )
+    monkeypatch.setattr(BaseSSHServerSession, "interactive_event", dummy_interactive_event)
 
     basic_server._interacting = True
     basic_server.data_received(data="something", datatype=None)
@@ -213,9 +214,7 @@ def test_data_received_return(monkeypatch, basic_server):
         nonlocal dispatched_to_repaint_prompt
         dispatched_to_repaint_prompt = True
 
-    monkeypatch.setattr(
-        "scrapli_replay.server.server.BaseSSHServerSession.repaint_prompt", dummy_repaint_prompt
-    )
+    monkeypatch.setattr(BaseSSHServerSession, "repaint_prompt", dummy_repaint_prompt)
 
     basic_server.data_received(data="\n", datatype=None)
     assert dispatched_to_repaint_prompt is True
@@ -228,24 +227,18 @@ def test_data_received_standard_event(monkeypatch, basic_server):
         nonlocal dispatched_to_standard_event
         dispatched_to_standard_event = True
 
-    monkeypatch.setattr(
-        "scrapli_replay.server.server.BaseSSHServerSession.standard_event", dummy_standard_event
-    )
+    monkeypatch.setattr(BaseSSHServerSession, "standard_event", dummy_standard_event)
 
-    basic_server.collect_data = {
-        "events": {
-            "veryprivvy": {
-                "pre_on_open": {
-                    "blah": {
-                        "channel_output": "someswitchoutput",
-                        "result_privilege_level": "newpriv",
-                        "returns_prompt": True,
-                        "closes_connection": False,
-                        "type": "standard",
-                    }
-                }
+    basic_server._events_flat = {
+        ("veryprivvy", "pre_on_open", "blah"): ServerEvent(
+            {
+                "channel_output": "someswitchoutput",
+                "result_privilege_level": "newpriv",
+                "returns_prompt": True,
+                "closes_connection": False,
+                "type": "standard",
             }
-        }
+        )
     }
 
     basic_server.data_received(data="blah", datatype=None)
@@ -259,30 +252,23 @@ def test_data_received_interact_event(monkeypatch, basic_server):
         nonlocal dispatched_to_interact_event
         dispatched_to_interact_event = True
 
-    monkeypatch.setattr(
-        "scrapli_replay.server.server.BaseSSHServerSession.interactive_event",
-        dummy_interactive_event,
-    )
+    monkeypatch.setattr(BaseSSHServerSession, "interactive_event", dummy_interactive_event)
 
-    basic_server.collect_data = {
-        "events": {
-            "veryprivvy": {
-                "pre_on_open": {
-                    "blah": {
-                        "result_privilege_level": "privilege_exec",
-                        "event_steps": [
-                            {
-                                "channel_input": "enable",
-                                "channel_output": "Password: ",
-                                "hidden_input": False,
-                                "returns_prompt": True,
-                            }
-                        ],
-                        "type": "interact",
+    basic_server._events_flat = {
+        ("veryprivvy", "pre_on_open", "blah"): ServerEvent(
+            {
+                "result_privilege_level": "privilege_exec",
+                "event_steps": [
+                    {
+                        "channel_input": "enable",
+                        "channel_output": "Password: ",
+                        "hidden_input": False,
+                        "returns_prompt": True,
                     }
-                }
+                ],
+                "type": "interact",
             }
-        }
+        )
     }
 
     basic_server.data_received(data="blah", datatype=None)
@@ -296,22 +282,17 @@ def test_data_received_unknown_event(monkeypatch, basic_server):
         nonlocal dispatched_to_unknown_event
         dispatched_to_unknown_event = True
 
-    monkeypatch.setattr(
-        "scrapli_replay.server.server.BaseSSHServerSession.unknown_event",
-        dummy_unknown_event,
-    )
+    monkeypatch.setattr(BaseSSHServerSession, "unknown_event", dummy_unknown_event)
 
-    basic_server.collect_data = {
-        "events": {"veryprivvy": {"pre_on_open": {}}},
-        "unknown_events": {
-            "veryprivvy": {
-                "pre_on_open": {
-                    "channel_output": "bad stuff",
-                    "closes_connection": False,
-                    "result_privilege_level": "veryprivvy",
-                }
+    basic_server._events_flat = {}
+    basic_server._unknown_events_flat = {
+        ("veryprivvy", "pre_on_open"): ServerEvent(
+            {
+                "channel_output": "bad stuff",
+                "closes_connection": False,
+                "result_privilege_level": "veryprivvy",
             }
-        },
+        )
     }
 
     basic_server.data_received(data="blah", datatype=None)